@@ -31,17 +31,28 @@ USAGE:
 """
 
 import argparse
+import collections
+import functools
+import itertools
 import json
 import logging
+import multiprocessing
 import os
 import random
+import shutil
+import sqlite3
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, timedelta
 from pathlib import Path
 from typing import List
 
+import ijson
+import numpy as np
 from faker import Faker
-from sqlalchemy import create_engine, func
+from sqlalchemy import create_engine, event, func, insert, select
 from sqlalchemy.orm import Session, sessionmaker
 from zava_shop_shared.models.sqlite import (
     Approver,
@@ -66,6 +77,22 @@ from zava_shop_shared.models.sqlite import (
 fake = Faker()
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Optional seed for reproducible runs, set from --seed
+_np_seed = None
+
+
+def seed_generators(seed: int):
+    """Seed every RNG the generator uses so a run is reproducible"""
+    global _np_seed
+    _np_seed = seed
+    random.seed(seed)
+    Faker.seed(seed)
+
+
+def _default_rng():
+    """NumPy generator honouring the --seed flag when one was given"""
+    return np.random.default_rng(_np_seed)
+
 # Reference data directory (relative to this file)
 REFERENCE_DATA_DIR = Path(__file__).parent.parent.parent / "data_reference"
 
@@ -81,67 +108,124 @@ SQLITE_DB_FILE = os.getenv("SQLITE_DB_FILE", str(Path(__file__).parent.parent.pa
 SUPER_MANAGER_UUID = "00000000-0000-0000-0000-000000000000"
 
 
-def load_stores_reference():
-    """Load stores reference data from JSON file"""
+def _load_json(filename: str):
+    """Load one reference JSON file from the reference data directory"""
     try:
-        filepath = REFERENCE_DATA_DIR / STORES_REFERENCE_FILE
-        with open(filepath, "r") as f:
+        with open(REFERENCE_DATA_DIR / filename, "r") as f:
             return json.load(f)
     except Exception as e:
-        logging.error(f"Failed to load {STORES_REFERENCE_FILE}: {e}")
+        logging.error(f"Failed to load {filename}: {e}")
         raise
 
 
-def load_product_data():
-    """Load product data from JSON file"""
-    try:
-        filepath = REFERENCE_DATA_DIR / PRODUCT_DATA_FILE
-        with open(filepath, "r") as f:
-            return json.load(f)
-    except Exception as e:
-        logging.error(f"Failed to load {PRODUCT_DATA_FILE}: {e}")
-        raise
+# Embedding vectors dominate the size of product_data.json; most phases
+# only need the scalar fields
+_EMBEDDING_KEYS = ("image_embedding", "description_embedding")
 
 
-def load_supplier_data():
-    """Load supplier data from JSON file"""
-    try:
-        filepath = REFERENCE_DATA_DIR / SUPPLIER_DATA_FILE
-        with open(filepath, "r") as f:
-            return json.load(f)
-    except Exception as e:
-        logging.error(f"Failed to load {SUPPLIER_DATA_FILE}: {e}")
-        raise
+def iter_products():
+    """Stream products one at a time from product_data.json
+
+    The file holds a full embedding vector (or two) per product, so parsing
+    it with json.load pins hundreds of MB. ijson yields one product dict at
+    a time and keeps the resident set at a single item.
+    """
+    filepath = REFERENCE_DATA_DIR / PRODUCT_DATA_FILE
+    with open(filepath, "rb") as f:
+        # use_float keeps numbers as float (not Decimal) for JSON/DB round-trips
+        yield from ijson.items(f, "products.item", use_float=True)
 
 
-# Load the reference data
-stores_reference = load_stores_reference()
-product_data = load_product_data()
-supplier_data = load_supplier_data()
+def iter_products_basic():
+    """Stream products with the bulky embedding vectors stripped"""
+    for product in iter_products():
+        for key in _EMBEDDING_KEYS:
+            product.pop(key, None)
+        yield product
 
-# Extract stores and products
+
+# Load the reference data in parallel; the parses release the GIL little,
+# but the file reads overlap. Products are streamed on demand, not held here
+with ThreadPoolExecutor(max_workers=2) as _loader:
+    stores_reference, supplier_data = _loader.map(_load_json, [STORES_REFERENCE_FILE, SUPPLIER_DATA_FILE])
+
+# Extract stores
 stores = stores_reference["stores"]
-products_list = product_data["products"]
+
+
+# Store names and cumulative distribution weights, computed once so every
+# draw skips the per-call list rebuild and cumulative sum
+_STORE_NAMES = tuple(config["store_name"] for config in stores.values())
+_STORE_CUM_WEIGHTS = tuple(
+    itertools.accumulate(config["customer_distribution_weight"] for config in stores.values())
+)
 
 
 def weighted_store_choice():
     """Choose a store based on weighted distribution"""
-    store_ids = list(stores.keys())
-    weights = [stores[store]["customer_distribution_weight"] for store in store_ids]
-    selected_id = random.choices(store_ids, weights=weights, k=1)[0]
-    return stores[selected_id]["store_name"]
+    return random.choices(_STORE_NAMES, cum_weights=_STORE_CUM_WEIGHTS, k=1)[0]
+
+
+def weighted_store_choices(k: int):
+    """Draw k weighted store names in a single C-level call"""
+    return random.choices(_STORE_NAMES, cum_weights=_STORE_CUM_WEIGHTS, k=k)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_date(value: str) -> date:
+    """Parse an ISO date string, memoized
+
+    Supplier contracts reuse a small set of start/end dates, so caching the
+    parse avoids re-running fromisoformat for every contract row.
+    """
+    return date.fromisoformat(value)
+
+
+def phase(name: str):
+    """Log and re-raise failures from a generation phase
+
+    Replaces the identical try/except/logging.error wrapper every phase
+    function used to carry inline.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logging.error(f"Error {name}: {e}")
+                raise
 
+        return wrapper
 
-def generate_phone_number():
-    """Generate a phone number in North American format (XXX) XXX-XXXX"""
-    return f"({random.randint(200, 999)}) {random.randint(200, 999)}-{random.randint(1000, 9999)}"
+    return decorator
 
 
 def create_engine_and_session():
     """Create SQLAlchemy engine and session"""
     try:
         db_url = f"sqlite:///{SQLITE_DB_FILE}"
-        engine = create_engine(db_url, echo=False)
+        engine = create_engine(db_url, echo=False, insertmanyvalues_page_size=5000)
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+            # The database is rebuilt from scratch, so journaling and fsyncs
+            # buy nothing until the load finishes (finalize_database restores
+            # durable settings); the large cache and mmap keep the working set
+            # in memory during generation. FK checks are redundant here since
+            # all rows are generated against freshly inserted parents.
+            cursor = dbapi_conn.cursor()
+            cursor.executescript(
+                "PRAGMA journal_mode=OFF;"
+                "PRAGMA synchronous=OFF;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-262144;"
+                "PRAGMA mmap_size=268435456;"
+                "PRAGMA foreign_keys=OFF;"
+            )
+            cursor.close()
+
         SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
         logging.info(f"Connected to SQLite database: {SQLITE_DB_FILE}")
         return engine, SessionLocal
@@ -150,559 +234,672 @@ def create_engine_and_session():
         raise
 
 
+@phase("creating database schema")
 def create_database_schema(engine):
     """Create database schema using SQLAlchemy models"""
+    logging.info("Creating database schema from SQLAlchemy models...")
+    Base.metadata.create_all(engine)
+    logging.info("Database schema created successfully!")
+
+
+@contextmanager
+def with_indexes_deferred(engine):
+    """Create tables without secondary indexes, then build them after the load
+
+    Detach every Index from the model metadata so create_all only emits the
+    tables, and create the indexes once the bulk insert has finished -
+    building a B-tree from sorted, populated data is far cheaper than
+    maintaining it row by row during the insert phase.
+    """
+    deferred = []
+    for table in Base.metadata.tables.values():
+        deferred.extend(table.indexes)
+        table.indexes.clear()
     try:
-        logging.info("Creating database schema from SQLAlchemy models...")
-        Base.metadata.create_all(engine)
-        logging.info("Database schema created successfully!")
-    except Exception as e:
-        logging.error(f"Error creating database schema: {e}")
-        raise
+        yield
+        logging.info(f"Creating {len(deferred)} deferred indexes...")
+        for index in deferred:
+            index.create(engine)
+        logging.info("Deferred indexes created successfully!")
+    finally:
+        for index in deferred:
+            index.table.indexes.add(index)
 
 
-def bulk_insert_objects(session: Session, objects: List, batch_size: int = 1000):
-    """Insert objects in batches using SQLAlchemy bulk operations"""
-    try:
-        for i in range(0, len(objects), batch_size):
-            batch = objects[i : i + batch_size]
-            session.bulk_save_objects(batch)
-            session.flush()
-        session.commit()
-    except Exception as e:
-        session.rollback()
-        raise e
+def bulk_insert_objects(session: Session, model, rows: List[dict]):
+    """Bulk insert dict rows through the SQLAlchemy 2.0 insertmanyvalues path
 
+    session.execute(insert(model), rows) emits multi-row INSERT ... VALUES
+    batches (paged by insertmanyvalues_page_size) instead of the legacy
+    row-at-a-time bulk_save_objects path. Transaction control lives with the
+    caller so the whole generation pipeline commits exactly once.
+    """
+    if rows:
+        session.execute(insert(model), rows)
 
+
+@phase("inserting stores")
 def insert_stores(session: Session):
     """Insert store data into the database"""
-    try:
-        logging.info("Generating stores...")
-        store_objects = []
+    logging.info("Generating stores...")
+    store_objects = []
 
-        for store_id, store_config in stores.items():
-            store_name = store_config["store_name"]
-            is_online = store_config["location"]["is_online"]
-            rls_user_id = store_config["rls_user_id"]
+    for store_id, store_config in stores.items():
+        store_name = store_config["store_name"]
+        is_online = store_config["location"]["is_online"]
+        rls_user_id = store_config["rls_user_id"]
 
-            if not rls_user_id:
-                raise ValueError(f"No rls_user_id found for store: {store_name}")
+        if not rls_user_id:
+            raise ValueError(f"No rls_user_id found for store: {store_name}")
 
-            store_objects.append(Store(store_name=store_name, rls_user_id=rls_user_id, is_online=is_online))
+        store_objects.append(dict(store_name=store_name, rls_user_id=rls_user_id, is_online=is_online))
 
-        bulk_insert_objects(session, store_objects)
+    bulk_insert_objects(session, Store, store_objects)
 
-        stores_in_db = session.query(Store).order_by(Store.store_name).all()
-        logging.info("Store Manager IDs (for RLS):")
-        for store in stores_in_db:
-            logging.info(f"  {store.store_name}: {store.rls_user_id}")
+    stores_in_db = session.query(Store).order_by(Store.store_name).all()
+    logging.info("Store Manager IDs (for RLS):")
+    for store in stores_in_db:
+        logging.info(f"  {store.store_name}: {store.rls_user_id}")
 
-        logging.info(f"Successfully inserted {len(store_objects):,} stores!")
-    except Exception as e:
-        logging.error(f"Error inserting stores: {e}")
-        raise
+    logging.info(f"Successfully inserted {len(store_objects):,} stores!")
 
 
+@phase("inserting categories")
 def insert_categories(session: Session):
     """Insert category data from products"""
-    try:
-        logging.info("Generating categories...")
+    logging.info("Generating categories...")
 
-        # Get unique categories from products
-        categories = set(product["category"] for product in products_list)
-        category_objects = [Category(category_name=cat) for cat in sorted(categories)]
+    # Get unique categories from products
+    categories = set(product["category"] for product in iter_products_basic())
+    category_objects = [dict(category_name=cat) for cat in sorted(categories)]
 
-        bulk_insert_objects(session, category_objects)
-        logging.info(f"Successfully inserted {len(category_objects):,} categories!")
-    except Exception as e:
-        logging.error(f"Error inserting categories: {e}")
-        raise
+    bulk_insert_objects(session, Category, category_objects)
+    logging.info(f"Successfully inserted {len(category_objects):,} categories!")
 
 
+@phase("inserting product types")
 def insert_product_types(session: Session):
     """Insert product type data from products"""
-    try:
-        logging.info("Generating product types...")
+    logging.info("Generating product types...")
 
-        # Get category mapping
-        categories_in_db = session.query(Category).all()
-        category_mapping = {cat.category_name: cat.category_id for cat in categories_in_db}
+    # Get category mapping
+    category_mapping = dict(session.execute(select(Category.category_name, Category.category_id)).all())
 
-        # Get unique category/subcategory combinations
-        type_set = set()
-        for product in products_list:
-            type_set.add((product["category"], product["subcategory"]))
+    # Get unique category/subcategory combinations
+    type_set = set()
+    for product in iter_products_basic():
+        type_set.add((product["category"], product["subcategory"]))
 
-        product_type_objects = []
-        for category, subcategory in sorted(type_set):
-            category_id = category_mapping[category]
-            product_type_objects.append(ProductType(category_id=category_id, type_name=subcategory))
+    product_type_objects = []
+    for category, subcategory in sorted(type_set):
+        category_id = category_mapping[category]
+        product_type_objects.append(dict(category_id=category_id, type_name=subcategory))
 
-        bulk_insert_objects(session, product_type_objects)
-        logging.info(f"Successfully inserted {len(product_type_objects):,} product types!")
-    except Exception as e:
-        logging.error(f"Error inserting product types: {e}")
-        raise
+    bulk_insert_objects(session, ProductType, product_type_objects)
+    logging.info(f"Successfully inserted {len(product_type_objects):,} product types!")
 
 
+@phase("inserting suppliers")
 def insert_suppliers(session: Session):
     """Insert supplier data from JSON file"""
-    try:
-        logging.info(f"Loading suppliers from {SUPPLIER_DATA_FILE}...")
-
-        supplier_objects = []
-        for supplier_id_str, supplier in supplier_data.items():
-            supplier_id = supplier["supplier_id"]
-
-            # Get contract data if available
-            payment_terms = supplier.get("payment_terms", "Net 30")
-            if "contracts" in supplier and len(supplier["contracts"]) > 0:
-                payment_terms = supplier["contracts"][0].get("payment_terms", payment_terms)
-
-            supplier_objects.append(
-                Supplier(
-                    supplier_id=supplier_id,
-                    supplier_name=supplier["supplier_name"],
-                    supplier_code=supplier["supplier_code"],
-                    contact_email=supplier["contact_email"],
-                    contact_phone=supplier["contact_phone"],
-                    address_line1="",
-                    address_line2="",
-                    city="Seattle",
-                    state_province="WA",
-                    postal_code="98000",
-                    country="USA",
-                    payment_terms=payment_terms,
-                    lead_time_days=supplier["lead_time_days"],
-                    minimum_order_amount=supplier["min_order_amount"],
-                    bulk_discount_threshold=supplier["min_order_amount"] * 5,
-                    bulk_discount_percent=supplier.get("bulk_discount_percent", 7.5),
-                    supplier_rating=supplier["rating"],
-                    esg_compliant=supplier["esg_compliant"],
-                    approved_vendor=supplier["approved_vendor"],
-                    preferred_vendor=supplier["preferred_vendor"],
-                )
+    logging.info(f"Loading suppliers from {SUPPLIER_DATA_FILE}...")
+
+    supplier_objects = []
+    for supplier_id_str, supplier in supplier_data.items():
+        supplier_id = supplier["supplier_id"]
+
+        # Get contract data if available
+        payment_terms = supplier.get("payment_terms", "Net 30")
+        if "contracts" in supplier and len(supplier["contracts"]) > 0:
+            payment_terms = supplier["contracts"][0].get("payment_terms", payment_terms)
+
+        supplier_objects.append(
+            dict(
+                supplier_id=supplier_id,
+                supplier_name=supplier["supplier_name"],
+                supplier_code=supplier["supplier_code"],
+                contact_email=supplier["contact_email"],
+                contact_phone=supplier["contact_phone"],
+                address_line1="",
+                address_line2="",
+                city="Seattle",
+                state_province="WA",
+                postal_code="98000",
+                country="USA",
+                payment_terms=payment_terms,
+                lead_time_days=supplier["lead_time_days"],
+                minimum_order_amount=supplier["min_order_amount"],
+                bulk_discount_threshold=supplier["min_order_amount"] * 5,
+                bulk_discount_percent=supplier.get("bulk_discount_percent", 7.5),
+                supplier_rating=supplier["rating"],
+                esg_compliant=supplier["esg_compliant"],
+                approved_vendor=supplier["approved_vendor"],
+                preferred_vendor=supplier["preferred_vendor"],
             )
+        )
 
-        bulk_insert_objects(session, supplier_objects)
-        logging.info(f"Successfully inserted {len(supplier_objects):,} suppliers!")
-
-        # Insert supplier contracts
-        logging.info("Generating supplier contracts...")
-        contract_objects = []
-        for supplier_id_str, supplier in supplier_data.items():
-            if "contracts" in supplier:
-                for contract in supplier["contracts"]:
-                    contract_objects.append(
-                        SupplierContract(
-                            supplier_id=supplier["supplier_id"],
-                            contract_number=contract["contract_number"],
-                            contract_status=contract["contract_status"],
-                            start_date=date.fromisoformat(contract["start_date"]),
-                            end_date=date.fromisoformat(contract["end_date"]),
-                            contract_value=contract["contract_value"],
-                            payment_terms=contract["payment_terms"],
-                            auto_renew=contract["auto_renew"],
-                        )
-                    )
-
-        if contract_objects:
-            bulk_insert_objects(session, contract_objects)
-            logging.info(f"Successfully inserted {len(contract_objects):,} supplier contracts!")
-
-        # Insert supplier performance data
-        logging.info("Generating supplier performance evaluations...")
-        suppliers_in_db = session.query(Supplier).all()
-        performance_objects = []
-
-        for supplier_obj in suppliers_in_db:
-            for months_ago in range(0, random.randint(3, 7)):
-                evaluation_date = date.today().replace(day=1) - timedelta(days=months_ago * 30)
-
-                base_cost_score = random.uniform(3.5, 4.8)
-                base_quality_score = random.uniform(3.2, 4.9)
-                base_delivery_score = random.uniform(3.0, 4.7)
-                base_compliance_score = random.uniform(4.2, 5.0)
-
-                cost_score = max(1.0, min(5.0, base_cost_score + random.uniform(-0.3, 0.3)))
-                quality_score = max(1.0, min(5.0, base_quality_score + random.uniform(-0.4, 0.4)))
-                delivery_score = max(1.0, min(5.0, base_delivery_score + random.uniform(-0.5, 0.5)))
-                compliance_score = max(1.0, min(5.0, base_compliance_score + random.uniform(-0.2, 0.2)))
-
-                overall_score = cost_score * 0.3 + quality_score * 0.3 + delivery_score * 0.25 + compliance_score * 0.15
-
-                performance_objects.append(
-                    SupplierPerformance(
-                        supplier_id=supplier_obj.supplier_id,
-                        evaluation_date=evaluation_date,
-                        cost_score=cost_score,
-                        quality_score=quality_score,
-                        delivery_score=delivery_score,
-                        compliance_score=compliance_score,
-                        overall_score=overall_score,
-                        notes=f"Monthly evaluation for {supplier_obj.supplier_name}",
+    bulk_insert_objects(session, Supplier, supplier_objects)
+    logging.info(f"Successfully inserted {len(supplier_objects):,} suppliers!")
+
+    # Insert supplier contracts
+    logging.info("Generating supplier contracts...")
+    contract_objects = []
+    for supplier_id_str, supplier in supplier_data.items():
+        if "contracts" in supplier:
+            for contract in supplier["contracts"]:
+                contract_objects.append(
+                    dict(
+                        supplier_id=supplier["supplier_id"],
+                        contract_number=contract["contract_number"],
+                        contract_status=contract["contract_status"],
+                        start_date=_parse_date(contract["start_date"]),
+                        end_date=_parse_date(contract["end_date"]),
+                        contract_value=contract["contract_value"],
+                        payment_terms=contract["payment_terms"],
+                        auto_renew=contract["auto_renew"],
                     )
                 )
 
-        bulk_insert_objects(session, performance_objects)
-        logging.info(f"Successfully inserted {len(performance_objects):,} supplier performance evaluations!")
+    if contract_objects:
+        bulk_insert_objects(session, SupplierContract, contract_objects)
+        logging.info(f"Successfully inserted {len(contract_objects):,} supplier contracts!")
+
+    # Insert supplier performance data
+    logging.info("Generating supplier performance evaluations...")
+    suppliers_in_db = session.execute(select(Supplier.supplier_id, Supplier.supplier_name)).all()
+    performance_objects = []
+
+    rng = _default_rng()
+    month_counts = rng.integers(3, 8, size=len(suppliers_in_db))
+    total_evals = int(month_counts.sum())
+
+    # Draw every (cost, quality, delivery, compliance) score at once:
+    # per-score base ranges plus per-score jitter, clipped to the 1-5
+    # rating scale, with the weighted overall score as a dot product
+    bases = rng.uniform([3.5, 3.2, 3.0, 4.2], [4.8, 4.9, 4.7, 5.0], size=(total_evals, 4))
+    jitter = rng.uniform([-0.3, -0.4, -0.5, -0.2], [0.3, 0.4, 0.5, 0.2], size=(total_evals, 4))
+    scores = np.clip(bases + jitter, 1.0, 5.0)
+    overall_scores = scores @ np.array([0.3, 0.3, 0.25, 0.15])
+
+    supplier_idx = np.repeat(np.arange(len(suppliers_in_db)), month_counts)
+    months_ago = np.concatenate([np.arange(count) for count in month_counts])
+    first_of_month = date.today().replace(day=1)
+
+    for row in range(total_evals):
+        supplier_id, supplier_name = suppliers_in_db[supplier_idx[row]]
+        performance_objects.append(
+            dict(
+                supplier_id=supplier_id,
+                evaluation_date=first_of_month - timedelta(days=int(months_ago[row]) * 30),
+                cost_score=float(scores[row, 0]),
+                quality_score=float(scores[row, 1]),
+                delivery_score=float(scores[row, 2]),
+                compliance_score=float(scores[row, 3]),
+                overall_score=float(overall_scores[row]),
+                notes=f"Monthly evaluation for {supplier_name}",
+            )
+        )
+
+    bulk_insert_objects(session, SupplierPerformance, performance_objects)
+    logging.info(f"Successfully inserted {len(performance_objects):,} supplier performance evaluations!")
 
-    except Exception as e:
-        logging.error(f"Error inserting suppliers: {e}")
-        raise
 
 
+@phase("inserting products")
 def insert_products(session: Session):
     """Insert product data from JSON file"""
-    try:
-        logging.info("Generating products...")
-
-        # Get mappings
-        categories_in_db = session.query(Category).all()
-        category_mapping = {cat.category_name: cat.category_id for cat in categories_in_db}
-
-        product_types_in_db = session.query(ProductType).all()
-        type_mapping = {}
-        for pt in product_types_in_db:
-            # Create key as (category_id, type_name)
-            type_mapping[(pt.category_id, pt.type_name)] = pt.type_id
-
-        # Get supplier lead times for products
-        supplier_lead_times = {int(sid): supplier["lead_time_days"] for sid, supplier in supplier_data.items()}
-
-        product_objects = []
-
-        for product in products_list:
-            category_id = category_mapping[product["category"]]
-            type_id = type_mapping.get((category_id, product["subcategory"]))
-
-            if not type_id:
-                logging.warning(f"Could not find type_id for {product['category']}/{product['subcategory']}")
-                continue
-
-            # Use supplier_id from product data
-            supplier_id = product["supplier_id"]
-
-            # Use price from JSON as base_price (store selling price)
-            base_price = float(product["price"])
-            # Calculate cost for 33% gross margin: Cost = Price × 0.67
-            cost = round(base_price * 0.67, 2)
-
-            # Extract image_url from image_path
-            image_path = product.get("image_path", "")
-            image_url = image_path.replace("images/", "") if image_path else None
-
-            # Get supplier's lead time for this product
-            procurement_lead_time = supplier_lead_times.get(supplier_id, 15)
-
-            product_objects.append(
-                Product(
-                    sku=product["sku"],
-                    product_name=product["name"],
-                    category_id=category_id,
-                    type_id=type_id,
-                    supplier_id=supplier_id,
-                    cost=cost,
-                    base_price=base_price,
-                    gross_margin_percent=33.00,
-                    product_description=product["description"],
-                    procurement_lead_time_days=procurement_lead_time,
-                    minimum_order_quantity=product.get("minimum_order_quantity", 10),
-                    discontinued=False,
-                    image_url=image_url,
-                )
+    logging.info("Generating products...")
+
+    # Get mappings
+    category_mapping = dict(session.execute(select(Category.category_name, Category.category_id)).all())
+
+    type_mapping = {
+        (category_id, type_name): type_id
+        for category_id, type_name, type_id in session.execute(
+            select(ProductType.category_id, ProductType.type_name, ProductType.type_id)
+        ).all()
+    }
+
+    # Get supplier lead times for products
+    supplier_lead_times = {int(sid): supplier["lead_time_days"] for sid, supplier in supplier_data.items()}
+
+    product_objects = []
+
+    for product in iter_products_basic():
+        category_id = category_mapping[product["category"]]
+        type_id = type_mapping.get((category_id, product["subcategory"]))
+
+        if not type_id:
+            logging.warning(f"Could not find type_id for {product['category']}/{product['subcategory']}")
+            continue
+
+        # Use supplier_id from product data
+        supplier_id = product["supplier_id"]
+
+        # Use price from JSON as base_price (store selling price)
+        base_price = float(product["price"])
+        # Calculate cost for 33% gross margin: Cost = Price × 0.67
+        cost = round(base_price * 0.67, 2)
+
+        # Extract image_url from image_path
+        image_path = product.get("image_path", "")
+        image_url = image_path.removeprefix("images/") if image_path else None
+
+        # Get supplier's lead time for this product
+        procurement_lead_time = supplier_lead_times.get(supplier_id, 15)
+
+        product_objects.append(
+            dict(
+                sku=product["sku"],
+                product_name=product["name"],
+                category_id=category_id,
+                type_id=type_id,
+                supplier_id=supplier_id,
+                cost=cost,
+                base_price=base_price,
+                gross_margin_percent=33.00,
+                product_description=product["description"],
+                procurement_lead_time_days=procurement_lead_time,
+                minimum_order_quantity=product.get("minimum_order_quantity", 10),
+                discontinued=False,
+                image_url=image_url,
             )
+        )
 
-        bulk_insert_objects(session, product_objects)
-        logging.info(f"Successfully inserted {len(product_objects):,} products!")
-    except Exception as e:
-        logging.error(f"Error inserting products: {e}")
-        raise
+    bulk_insert_objects(session, Product, product_objects)
+    logging.info(f"Successfully inserted {len(product_objects):,} products!")
 
 
+@phase("populating embeddings")
 def populate_product_embeddings(session: Session):
-    """Populate product embeddings from product_data.json as JSON strings"""
-    try:
-        logging.info("Populating product embeddings...")
+    """Populate product embeddings from product_data.json as float32 blobs"""
+    logging.info("Populating product embeddings...")
 
-        # Get product SKU to ID mapping
-        products_in_db = session.query(Product).all()
-        sku_to_id = {p.sku: p.product_id for p in products_in_db}
+    # Get product SKU to ID mapping
+    sku_to_id = dict(session.execute(select(Product.sku, Product.product_id)).all())
 
-        image_embedding_objects = []
-        description_embedding_objects = []
+    image_rows = []
+    description_rows = []
 
-        for product in products_list:
-            sku = product["sku"]
-            product_id = sku_to_id.get(sku)
+    for product in iter_products():
+        sku = product["sku"]
+        product_id = sku_to_id.get(sku)
 
-            if not product_id:
-                continue
+        if not product_id:
+            continue
 
-            # Store image embedding as JSON string
-            if product.get("image_embedding"):
-                embedding_json = json.dumps(product["image_embedding"])
-                image_embedding_objects.append(
-                    ProductImageEmbedding(product_id=product_id, image_embedding=embedding_json)
-                )
+        # Pack embeddings as raw little-endian float32 bytes: ~4x smaller
+        # than JSON text and readable back with a zero-copy np.frombuffer
+        if product.get("image_embedding"):
+            image_rows.append((product_id, np.asarray(product["image_embedding"], dtype="<f4").tobytes()))
 
-            # Store description embedding as JSON string
-            if product.get("description_embedding"):
-                embedding_json = json.dumps(product["description_embedding"])
-                description_embedding_objects.append(
-                    ProductDescriptionEmbedding(product_id=product_id, description_embedding=embedding_json)
-                )
+        if product.get("description_embedding"):
+            description_rows.append((product_id, np.asarray(product["description_embedding"], dtype="<f4").tobytes()))
 
-        if image_embedding_objects:
-            bulk_insert_objects(session, image_embedding_objects)
-            logging.info(f"Successfully inserted {len(image_embedding_objects):,} image embeddings!")
+    # Embeddings are the largest table by bytes; write the prebuilt tuples
+    # straight through the session's DBAPI cursor rather than wrapping
+    # each multi-KB payload in ORM state. Using the session's own
+    # connection keeps the rows inside the single pipeline transaction.
+    cursor = session.connection().connection.cursor()
+    try:
+        if image_rows:
+            cursor.executemany(
+                "INSERT INTO product_image_embeddings (product_id, image_embedding) VALUES (?, ?)",
+                image_rows,
+            )
+            logging.info(f"Successfully inserted {len(image_rows):,} image embeddings!")
 
-        if description_embedding_objects:
-            bulk_insert_objects(session, description_embedding_objects)
-            logging.info(f"Successfully inserted {len(description_embedding_objects):,} description embeddings!")
+        if description_rows:
+            cursor.executemany(
+                "INSERT INTO product_description_embeddings (product_id, description_embedding) VALUES (?, ?)",
+                description_rows,
+            )
+            logging.info(f"Successfully inserted {len(description_rows):,} description embeddings!")
+    finally:
+        cursor.close()
 
-    except Exception as e:
-        logging.error(f"Error populating embeddings: {e}")
-        raise
 
 
+@phase("inserting customers")
 def insert_customers(session: Session, num_customers: int = 10000):
     """Insert customer data into the database"""
-    try:
-        logging.info(f"Generating {num_customers:,} customers...")
+    logging.info(f"Generating {num_customers:,} customers...")
+
+    store_name_to_id = dict(session.execute(select(Store.store_name, Store.store_id)).all())
+
+    if not store_name_to_id:
+        raise Exception("No stores found! Please insert stores first.")
+
+    # Faker provider calls dominate this loop, so sample ~2000 distinct
+    # names once and draw from the pools at C level instead of calling
+    # Faker per customer
+    first_pool = [fake.first_name().replace("'", "") for _ in range(2000)]
+    last_pool = [fake.last_name().replace("'", "") for _ in range(2000)]
+    first_names = random.choices(first_pool, k=num_customers)
+    last_names = random.choices(last_pool, k=num_customers)
+
+    # All phone number fields in three bulk draws
+    rng = _default_rng()
+    areas = rng.integers(200, 1000, size=num_customers)
+    exchanges = rng.integers(200, 1000, size=num_customers)
+    subscribers = rng.integers(1000, 10000, size=num_customers)
+
+    default_store_id = next(iter(store_name_to_id.values()))
+    preferred_store_names = weighted_store_choices(num_customers)
+    customer_objects = [
+        dict(
+            first_name=first_name,
+            last_name=last_name,
+            email=f"{first_name.lower()}.{last_name.lower()}.{i}@example.com",
+            phone=f"({area}) {exchange}-{subscriber}",
+            primary_store_id=store_name_to_id.get(store_name, default_store_id),
+        )
+        for i, (first_name, last_name, area, exchange, subscriber, store_name) in enumerate(
+            zip(first_names, last_names, areas, exchanges, subscribers, preferred_store_names), 1
+        )
+    ]
 
-        stores_in_db = session.query(Store).all()
-        store_name_to_id = {s.store_name: s.store_id for s in stores_in_db}
+    bulk_insert_objects(session, Customer, customer_objects)
 
-        if not stores_in_db:
-            raise Exception("No stores found! Please insert stores first.")
+    # Log customer distribution from the draws we just made instead of
+    # re-aggregating the freshly inserted rows with a GROUP BY
+    distribution = collections.Counter(preferred_store_names).most_common()
 
-        customer_objects = []
+    logging.info("Customer distribution by store:")
+    for store_name, customer_count in distribution:
+        percentage = (customer_count / num_customers * 100) if num_customers > 0 else 0
+        logging.info(f"  {store_name}: {customer_count:,} customers ({percentage:.1f}%)")
 
-        for i in range(1, num_customers + 1):
-            first_name = fake.first_name().replace("'", "")
-            last_name = fake.last_name().replace("'", "")
-            email = f"{first_name.lower()}.{last_name.lower()}.{i}@example.com"
-            phone = generate_phone_number()
+    logging.info(f"Successfully inserted {num_customers:,} customers!")
 
-            preferred_store_name = weighted_store_choice()
-            primary_store_id = store_name_to_id.get(preferred_store_name, stores_in_db[0].store_id)
 
-            customer_objects.append(
-                Customer(
-                    first_name=first_name,
-                    last_name=last_name,
-                    email=email,
-                    phone=phone,
-                    primary_store_id=primary_store_id,
-                )
-            )
+@phase("inserting inventory")
+def insert_inventory(session: Session):
+    """Insert inventory based on store product assignments from stores_reference.json"""
+    logging.info("Generating inventory from store product assignments...")
 
-        bulk_insert_objects(session, customer_objects)
+    store_name_to_id = dict(session.execute(select(Store.store_name, Store.store_id)).all())
 
-        # Log customer distribution
-        distribution = (
-            session.query(Store.store_name, func.count(Customer.customer_id).label("customer_count"))
-            .outerjoin(Customer, Store.store_id == Customer.primary_store_id)
-            .group_by(Store.store_id, Store.store_name)
-            .order_by(func.count(Customer.customer_id).desc())
-            .all()
-        )
+    sku_to_product_id = dict(session.execute(select(Product.sku, Product.product_id)).all())
 
-        logging.info("Customer distribution by store:")
-        for store_name, customer_count in distribution:
-            percentage = (customer_count / num_customers * 100) if num_customers > 0 else 0
-            logging.info(f"  {store_name}: {customer_count:,} customers ({percentage:.1f}%)")
+    # Create SKU to stock_level mapping from product_data.json
+    sku_to_stock_level = {product["sku"]: product.get("stock_level", 25) for product in iter_products_basic()}
 
-        logging.info(f"Successfully inserted {num_customers:,} customers!")
-    except Exception as e:
-        logging.error(f"Error inserting customers: {e}")
-        raise
+    inventory_objects = []
 
+    for store_id, store_config in stores.items():
+        store_name = store_config["store_name"]
+        db_store_id = store_name_to_id.get(store_name)
 
-def insert_inventory(session: Session):
-    """Insert inventory based on store product assignments from stores_reference.json"""
-    try:
-        logging.info("Generating inventory from store product assignments...")
+        if not db_store_id:
+            continue
 
-        stores_in_db = session.query(Store).all()
-        store_name_to_id = {s.store_name: s.store_id for s in stores_in_db}
+        # Get product SKUs for this store
+        product_skus = store_config.get("product_skus", [])
 
-        products_in_db = session.query(Product).all()
-        sku_to_product_id = {p.sku: p.product_id for p in products_in_db}
+        for sku in product_skus:
+            product_id = sku_to_product_id.get(sku)
+            if product_id:
+                # Use stock_level from product_data.json for reproducibility
+                stock_level = sku_to_stock_level.get(sku, 25)
+                inventory_objects.append(
+                    dict(store_id=db_store_id, product_id=product_id, stock_level=stock_level)
+                )
 
-        # Create SKU to stock_level mapping from product_data.json
-        sku_to_stock_level = {product["sku"]: product.get("stock_level", 25) for product in products_list}
+    bulk_insert_objects(session, Inventory, inventory_objects)
+    logging.info(f"Successfully inserted {len(inventory_objects):,} inventory records!")
 
-        inventory_objects = []
 
-        for store_id, store_config in stores.items():
-            store_name = store_config["store_name"]
-            db_store_id = store_name_to_id.get(store_name)
 
-            if not db_store_id:
-                continue
+# Orders are generated in bounded slices so a worker's peak RAM stays
+# constant no matter how large its shard is
+_ORDER_SLICE = 10000
 
-            # Get product SKUs for this store
-            product_skus = store_config.get("product_skus", [])
 
-            for sku in product_skus:
-                product_id = sku_to_product_id.get(sku)
-                if product_id:
-                    # Use stock_level from product_data.json for reproducibility
-                    stock_level = sku_to_stock_level.get(sku, 25)
-                    inventory_objects.append(
-                        Inventory(store_id=db_store_id, product_id=product_id, stock_level=stock_level)
-                    )
+def _generate_orders_shard(shard_args):
+    """Worker: generate one shard of orders/order_items into a temp SQLite file
 
-        bulk_insert_objects(session, inventory_objects)
-        logging.info(f"Successfully inserted {len(inventory_objects):,} inventory records!")
-
-    except Exception as e:
-        logging.error(f"Error inserting inventory: {e}")
-        raise
+    Runs in a separate process, so the pure-RNG row construction escapes the
+    GIL. The shard file is disposable; durability PRAGMAs are off. The shard
+    is generated in _ORDER_SLICE-order batches: each batch's arrays and rows
+    are written out and dropped before the next batch is drawn.
+    """
+    (shard_path, order_id_start, shard_orders, customer_ids, store_ids, product_ids, base_prices, seed) = shard_args
 
+    rng = np.random.default_rng(seed)
+    customer_arr = np.array(customer_ids, dtype=np.int64)
+    store_arr = np.array(store_ids, dtype=np.int64)
+    product_id_arr = np.array(product_ids, dtype=np.int64)
+    base_price_arr = np.array(base_prices, dtype=np.float64)
+    today = date.today()
 
-def insert_orders_and_items(session: Session, num_orders: int = 100000):
-    """Insert order and order item data (NO seasonal variations)"""
+    conn = sqlite3.connect(shard_path)
     try:
-        logging.info(f"Generating {num_orders:,} orders...")
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("CREATE TABLE orders (order_id INTEGER, customer_id INTEGER, store_id INTEGER, order_date TEXT)")
+        conn.execute(
+            "CREATE TABLE order_items (order_id INTEGER, store_id INTEGER, product_id INTEGER, "
+            "quantity INTEGER, unit_price REAL, discount_percent INTEGER, discount_amount REAL, "
+            "total_amount REAL)"
+        )
 
-        # Get customers
-        customer_ids = [c.customer_id for c in session.query(Customer.customer_id).all()]
-        if not customer_ids:
-            raise Exception("No customers found!")
+        for slice_start in range(0, shard_orders, _ORDER_SLICE):
+            slice_orders = min(_ORDER_SLICE, shard_orders - slice_start)
+            order_ids = np.arange(
+                order_id_start + slice_start,
+                order_id_start + slice_start + slice_orders,
+                dtype=np.int64,
+            )
+            order_customers = rng.choice(customer_arr, size=slice_orders)
+            order_stores = rng.choice(store_arr, size=slice_orders)
+            # Random date in last 2 years (NO seasonal variation)
+            day_offsets = rng.integers(0, 731, size=slice_orders)
+
+            items_per_order = rng.integers(1, 6, size=slice_orders)
+            total_items = int(items_per_order.sum())
+            item_order_ids = np.repeat(order_ids, items_per_order)
+            item_store_ids = np.repeat(rng.choice(store_arr, size=slice_orders), items_per_order)
+            product_idx = rng.integers(0, len(product_id_arr), size=total_items)
+            quantities = rng.integers(1, 11, size=total_items)
+            unit_prices = base_price_arr[product_idx]
+            discount_percents = rng.choice([0, 0, 0, 5, 10, 15], size=total_items)
+            discount_amounts = np.round((unit_prices * quantities * discount_percents) / 100, 2)
+            total_amounts = np.round((unit_prices * quantities) - discount_amounts, 2)
+
+            conn.executemany(
+                "INSERT INTO orders VALUES (?, ?, ?, ?)",
+                (
+                    (int(oid), int(cid), int(sid), (today - timedelta(days=int(offset))).isoformat())
+                    for oid, cid, sid, offset in zip(order_ids, order_customers, order_stores, day_offsets)
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO order_items VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (int(oid), int(sid), int(pid), int(qty), float(price), int(disc), float(damt), float(total))
+                    for oid, sid, pid, qty, price, disc, damt, total in zip(
+                        item_order_ids,
+                        item_store_ids,
+                        product_id_arr[product_idx],
+                        quantities,
+                        unit_prices,
+                        discount_percents,
+                        discount_amounts,
+                        total_amounts,
+                    )
+                ),
+            )
+        conn.commit()
+    finally:
+        conn.close()
 
-        # Get stores
-        stores_in_db = session.query(Store).all()
-        store_ids = [s.store_id for s in stores_in_db]
+    return shard_path
 
-        # Get products with prices
-        products = session.query(Product.product_id, Product.base_price).all()
-        product_list = [(p.product_id, p.base_price) for p in products]
 
-        order_objects = []
-        order_item_objects = []
+@phase("inserting orders")
+def insert_orders_and_items(session: Session, num_orders: int = 100000):
+    """Insert order and order item data (NO seasonal variations)
+
+    Generation is sharded across worker processes; each shard lands in its
+    own temp SQLite file and the shards are merged into the main database
+    with ATTACH + INSERT ... SELECT. Runs outside the main pipeline
+    transaction because ATTACH is not allowed inside one.
+    """
+    logging.info(f"Generating {num_orders:,} orders...")
+
+    # Get customers
+    customer_ids = list(session.execute(select(Customer.customer_id)).scalars())
+    if not customer_ids:
+        raise Exception("No customers found!")
+
+    # Get stores
+    store_ids = list(session.execute(select(Store.store_id)).scalars())
+
+    # Get products with prices
+    products = session.execute(select(Product.product_id, Product.base_price)).all()
+    product_ids = [product_id for product_id, _ in products]
+    base_prices = [float(base_price) for _, base_price in products]
+
+    # Release the session's read snapshot so the merge connection below
+    # sees a consistent database and statistics read fresh data afterwards
+    session.rollback()
+
+    # Orders get IDs 1..num_orders across shards (fresh database)
+    num_workers = max(1, min(os.cpu_count() or 1, 8))
+    base_count = num_orders // num_workers
+    counts = [base_count + (1 if i < num_orders % num_workers else 0) for i in range(num_workers)]
+
+    shard_dir = tempfile.mkdtemp(prefix="zava_order_shards_")
+    seeds = np.random.SeedSequence(_np_seed).spawn(num_workers)
+    shard_args = []
+    next_order_id = 1
+    for i, count in enumerate(counts):
+        if count == 0:
+            continue
+        shard_args.append(
+            (
+                os.path.join(shard_dir, f"shard{i}.db"),
+                next_order_id,
+                count,
+                customer_ids,
+                store_ids,
+                product_ids,
+                base_prices,
+                int(seeds[i].generate_state(1)[0]),
+            )
+        )
+        next_order_id += count
 
-        # Generate orders
-        for i in range(num_orders):
-            customer_id = random.choice(customer_ids)
-            store_id = random.choice(store_ids)
-            # Random date in last 2 years (NO seasonal variation)
-            order_date = date.today() - timedelta(days=random.randint(0, 730))
-
-            order = Order(customer_id=customer_id, store_id=store_id, order_date=order_date)
-            order_objects.append(order)
-
-        # Insert orders first to get IDs
-        bulk_insert_objects(session, order_objects)
-
-        # Get inserted order IDs
-        order_ids = [
-            o.order_id for o in session.query(Order.order_id).order_by(Order.order_id.desc()).limit(num_orders).all()
-        ]
-        order_ids.reverse()
-
-        # Create order items
-        logging.info("Generating order items...")
-        for order_id in order_ids:
-            store_id = random.choice(store_ids)
-
-            # Add 1-5 items per order
-            num_items = random.randint(1, 5)
-            for _ in range(num_items):
-                product_id, base_price = random.choice(product_list)
-                quantity = random.randint(1, 10)
-                unit_price = float(base_price)
-                discount_percent = random.choice([0, 0, 0, 5, 10, 15])
-                discount_amount = round((unit_price * quantity * discount_percent) / 100, 2)
-                total_amount = round((unit_price * quantity) - discount_amount, 2)
-
-                order_item_objects.append(
-                    OrderItem(
-                        order_id=order_id,
-                        store_id=store_id,
-                        product_id=product_id,
-                        quantity=quantity,
-                        unit_price=unit_price,
-                        discount_percent=discount_percent,
-                        discount_amount=discount_amount,
-                        total_amount=total_amount,
+    try:
+        # Consume shards as workers finish them (imap_unordered) so merging
+        # overlaps with generation instead of waiting for the slowest worker;
+        # sqlite3 releases the GIL around the INSERT ... SELECT anyway
+        merge_conn = sqlite3.connect(SQLITE_DB_FILE)
+        try:
+            merge_conn.execute("PRAGMA synchronous=NORMAL")
+            with multiprocessing.Pool(len(shard_args)) as pool:
+                for shard_path in pool.imap_unordered(_generate_orders_shard, shard_args):
+                    merge_conn.execute("ATTACH DATABASE ? AS shard", (shard_path,))
+                    merge_conn.execute(
+                        "INSERT INTO orders (order_id, customer_id, store_id, order_date) "
+                        "SELECT order_id, customer_id, store_id, order_date FROM shard.orders"
                     )
-                )
-
-        bulk_insert_objects(session, order_item_objects)
+                    merge_conn.execute(
+                        "INSERT INTO order_items (order_id, store_id, product_id, quantity, unit_price, "
+                        "discount_percent, discount_amount, total_amount) "
+                        "SELECT order_id, store_id, product_id, quantity, unit_price, "
+                        "discount_percent, discount_amount, total_amount FROM shard.order_items"
+                    )
+                    merge_conn.commit()
+                    merge_conn.execute("DETACH DATABASE shard")
+                    os.unlink(shard_path)
+            total_items = merge_conn.execute("SELECT COUNT(*) FROM order_items").fetchone()[0]
+        finally:
+            merge_conn.close()
+    finally:
+        shutil.rmtree(shard_dir, ignore_errors=True)
 
-        logging.info(f"Successfully inserted {len(order_objects):,} orders!")
-        logging.info(f"Successfully inserted {len(order_item_objects):,} order items!")
+    logging.info(f"Successfully inserted {num_orders:,} orders!")
+    logging.info(f"Successfully inserted {total_items:,} order items!")
 
-    except Exception as e:
-        logging.error(f"Error inserting orders: {e}")
-        raise
 
 
+@phase("inserting agent support data")
 def insert_agent_support_data(session: Session):
     """Insert minimal agent support data (approvers, policies, etc.)"""
+    logging.info("Generating agent support data...")
+
+    # Generate approvers
+    approver_objects = [
+        dict(
+            employee_id="EXEC001",
+            full_name="Jane CEO",
+            email="jane.ceo@zavadiy.com",
+            department="Management",
+            approval_limit=1000000,
+            is_active=True,
+        ),
+        dict(
+            employee_id="DIR001",
+            full_name="John Finance Director",
+            email="john.director@zavadiy.com",
+            department="Finance",
+            approval_limit=250000,
+            is_active=True,
+        ),
+        dict(
+            employee_id="MGR001",
+            full_name="Mike Procurement Manager",
+            email="mike.proc@zavadiy.com",
+            department="Procurement",
+            approval_limit=50000,
+            is_active=True,
+        ),
+    ]
+
+    bulk_insert_objects(session, Approver, approver_objects)
+
+    # Generate company policies
+    policy_objects = [
+        dict(
+            policy_name="Procurement Policy",
+            policy_type="procurement",
+            policy_content="All purchases over $5,000 require manager approval.",
+            department="Procurement",
+            minimum_order_threshold=5000,
+            approval_required=True,
+        ),
+        dict(
+            policy_name="Budget Authorization",
+            policy_type="budget_authorization",
+            policy_content="Spending limits: Manager $50K, Director $250K, Executive $1M+",
+            department="Finance",
+            approval_required=True,
+        ),
+    ]
+
+    bulk_insert_objects(session, CompanyPolicy, policy_objects)
+
+    logging.info(f"Successfully inserted {len(approver_objects)} approvers!")
+    logging.info(f"Successfully inserted {len(policy_objects)} company policies!")
+
+
+
+def finalize_database(session: Session):
+    """Restore durable settings and refresh planner stats after the load"""
+    cursor = session.connection().connection.cursor()
     try:
-        logging.info("Generating agent support data...")
-
-        # Generate approvers
-        approver_objects = [
-            Approver(
-                employee_id="EXEC001",
-                full_name="Jane CEO",
-                email="jane.ceo@zavadiy.com",
-                department="Management",
-                approval_limit=1000000,
-                is_active=True,
-            ),
-            Approver(
-                employee_id="DIR001",
-                full_name="John Finance Director",
-                email="john.director@zavadiy.com",
-                department="Finance",
-                approval_limit=250000,
-                is_active=True,
-            ),
-            Approver(
-                employee_id="MGR001",
-                full_name="Mike Procurement Manager",
-                email="mike.proc@zavadiy.com",
-                department="Procurement",
-                approval_limit=50000,
-                is_active=True,
-            ),
-        ]
-
-        bulk_insert_objects(session, approver_objects)
-
-        # Generate company policies
-        policy_objects = [
-            CompanyPolicy(
-                policy_name="Procurement Policy",
-                policy_type="procurement",
-                policy_content="All purchases over $5,000 require manager approval.",
-                department="Procurement",
-                minimum_order_threshold=5000,
-                approval_required=True,
-            ),
-            CompanyPolicy(
-                policy_name="Budget Authorization",
-                policy_type="budget_authorization",
-                policy_content="Spending limits: Manager $50K, Director $250K, Executive $1M+",
-                department="Finance",
-                approval_required=True,
-            ),
-        ]
-
-        bulk_insert_objects(session, policy_objects)
-
-        logging.info(f"Successfully inserted {len(approver_objects)} approvers!")
-        logging.info(f"Successfully inserted {len(policy_objects)} company policies!")
-
-    except Exception as e:
-        logging.error(f"Error inserting agent support data: {e}")
-        raise
+        cursor.executescript(
+            "PRAGMA foreign_keys=ON;"
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "ANALYZE;"
+            "PRAGMA optimize;"
+        )
+    finally:
+        cursor.close()
+    session.rollback()
 
 
 def show_statistics(session: Session):
@@ -755,9 +952,13 @@ def main():
     parser.add_argument("--show-stats", action="store_true", help="Show database statistics")
     parser.add_argument("--num-customers", type=int, default=10000, help="Number of customers (default: 10000)")
     parser.add_argument("--num-orders", type=int, default=100000, help="Number of orders (default: 100000)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed RNGs for a reproducible run")
 
     args = parser.parse_args()
 
+    if args.seed is not None:
+        seed_generators(args.seed)
+
     try:
         engine, SessionLocal = create_engine_and_session()
 
@@ -779,28 +980,37 @@ def main():
             Path(SQLITE_DB_FILE).unlink()
             logging.info("Removed existing database")
 
-        # Create schema
-        create_database_schema(engine)
-
         # Create session for data insertion
         session = SessionLocal()
 
         try:
-            # Insert reference data
-            insert_stores(session)
-            insert_categories(session)
-            insert_product_types(session)
-            insert_suppliers(session)
-            insert_products(session)
-            populate_product_embeddings(session)
-
-            # Insert transactional data
-            insert_customers(session, num_customers=args.num_customers)
-            insert_inventory(session)
-            insert_orders_and_items(session, num_orders=args.num_orders)
-
-            # Insert agent support data
-            insert_agent_support_data(session)
+            # Secondary indexes are built after the bulk load; one transaction
+            # spans the whole pipeline with a single commit at the end and
+            # automatic rollback on exception
+            with with_indexes_deferred(engine):
+                create_database_schema(engine)
+
+                with session.begin():
+                    # Insert reference data
+                    insert_stores(session)
+                    insert_categories(session)
+                    insert_product_types(session)
+                    insert_suppliers(session)
+                    insert_products(session)
+                    populate_product_embeddings(session)
+
+                    # Insert transactional data
+                    insert_customers(session, num_customers=args.num_customers)
+                    insert_inventory(session)
+
+                    # Insert agent support data
+                    insert_agent_support_data(session)
+
+                # Orders are sharded across processes and merged via ATTACH,
+                # which cannot run inside the pipeline transaction
+                insert_orders_and_items(session, num_orders=args.num_orders)
+
+            finalize_database(session)
 
             # Show statistics
             show_statistics(session)
@@ -5,64 +5,39 @@ Test script to verify MCP servers can connect to the new SQLite database.
 
 import asyncio
 import sys
+from pathlib import Path
 
-sys.path.insert(0, "/workspace/new/app/shared/src")
+sys.path.insert(0, str(Path(__file__).parent.parent / "shared" / "src"))
 
-from zava_shop_shared.config import Config
-from zava_shop_shared.finance_sqlite import FinanceSQLiteProvider
-from zava_shop_shared.supplier_sqlite import SupplierSQLiteProvider
-
-
-async def test_finance_connection():
-    """Test Finance MCP database connection."""
-    print("Testing Finance MCP database connection...")
-    db = InventorySQLiteProvider()
+from sqlalchemy import text
 
-    try:
-        await db.open_engine()
-        async with db.get_session() as session:
-            from sqlalchemy import text
+from zava_shop_shared.config import Config
+from zava_shop_shared.inventory_sqlite import InventorySQLiteProvider
 
-            result = await session.execute(text("SELECT COUNT(*) FROM stores"))
-            count = result.scalar()
-            print(f"✅ Finance MCP: Successfully connected! Found {count} stores.")
-    except Exception as e:
-        print(f"❌ Finance MCP connection failed: {e}")
-        raise
-    finally:
-        await db.close_engine()
+# Tables the MCP servers query on startup; checked over one shared engine
+# instead of opening a provider (pool + aiosqlite thread) per check
+CONNECTION_CHECKS = ("stores", "suppliers")
 
 
-async def test_supplier_connection():
-    """Test Supplier MCP database connection."""
-    print("\nTesting Supplier MCP database connection...")
-    db = SupplierSQLiteProvider()
+async def test_table_counts(db: InventorySQLiteProvider) -> None:
+    """Test MCP database connectivity via the tables each server reads."""
+    for table in CONNECTION_CHECKS:
+        print(f"Testing {table} table access...")
+        try:
+            async with db.get_session() as session:
+                result = await session.execute(text(f"SELECT COUNT(*) FROM {table}"))  # noqa: S608
+                count = result.scalar()
+                print(f"✅ Successfully connected! Found {count} {table}.")
+        except Exception as e:
+            print(f"❌ {table} connection failed: {e}")
+            raise
 
-    try:
-        await db.open_engine()
-        async with db.get_session() as session:
-            from sqlalchemy import text
 
-            result = await session.execute(text("SELECT COUNT(*) FROM suppliers"))
-            count = result.scalar()
-            print(f"✅ Supplier MCP: Successfully connected! Found {count} suppliers.")
-    except Exception as e:
-        print(f"❌ Supplier MCP connection failed: {e}")
-        raise
-    finally:
-        await db.close_engine()
-
-
-async def test_database_schema():
+async def test_database_schema(db: InventorySQLiteProvider) -> None:
     """Test that all expected tables exist."""
     print("\nTesting database schema...")
-    db = FinanceSQLiteProvider()
-
     try:
-        await db.open_engine()
         async with db.get_session() as session:
-            from sqlalchemy import text
-
             result = await session.execute(text("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"))
             tables = [row[0] for row in result.fetchall()]
             print(f"✅ Found {len(tables)} tables:")
@@ -71,12 +46,10 @@ async def test_database_schema():
     except Exception as e:
         print(f"❌ Schema test failed: {e}")
         raise
-    finally:
-        await db.close_engine()
 
 
 async def main():
-    """Run all connection tests."""
+    """Run all connection tests against one shared engine."""
     print("=" * 80)
     print("MCP Database Connection Tests")
     print("=" * 80)
@@ -85,9 +58,13 @@ async def main():
     print(f"\nDatabase URL: {config.sqlite_database_url}")
     print()
 
-    await test_finance_connection()
-    await test_supplier_connection()
-    await test_database_schema()
+    db = InventorySQLiteProvider()
+    await db.open_engine()
+    try:
+        await test_table_counts(db)
+        await test_database_schema(db)
+    finally:
+        await db.close_engine()
 
     print("\n" + "=" * 80)
     print("✅ All MCP database connection tests passed!")
@@ -2,16 +2,52 @@
 Test reproducibility: Generate database twice and verify inventory is identical
 """
 
+import hashlib
+import importlib
+import os
 import sqlite3
-import subprocess
+import sys
 from pathlib import Path
 
 DB_FILE = Path(__file__).parent / "retail.db"
 DB_FILE_2 = Path(__file__).parent / "retail2.db"
+SRC_DIR = Path(__file__).parent / "src"
+SHARED_SRC_DIR = Path(__file__).parent.parent / "shared" / "src"
+
+
+def generate_database(db_path):
+    """Run the data generator in-process against db_path
+
+    Importing the generator module avoids spawning a second interpreter;
+    SQLITE_DB_FILE is read at module import, so the module is (re)loaded
+    after the override.
+    """
+    os.environ["SQLITE_DB_FILE"] = str(db_path)
+    for src in (str(SRC_DIR), str(SHARED_SRC_DIR)):
+        if src not in sys.path:
+            sys.path.insert(0, src)
+
+    module_name = "zava_shop_datagenerator.__main__"
+    if module_name in sys.modules:
+        module = importlib.reload(sys.modules[module_name])
+    else:
+        module = importlib.import_module(module_name)
+
+    saved_argv = sys.argv
+    sys.argv = ["zava_shop_datagenerator"]
+    try:
+        module.main()
+    finally:
+        sys.argv = saved_argv
 
 
 def get_inventory_hash(db_path):
-    """Get a hash of inventory assignments including stock levels"""
+    """Hash inventory assignments (including stock levels) incrementally
+
+    Folds each ordered row into a 16-byte blake2b digest instead of
+    building one giant signature string, so comparison is O(1) and peak
+    memory stays constant. Returns (hexdigest, row_count).
+    """
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
@@ -23,12 +59,14 @@ def get_inventory_hash(db_path):
         ORDER BY s.store_name, p.sku
     """)
 
-    inventory_signature = []
-    for store_name, sku, stock in cursor.fetchall():
-        inventory_signature.append(f"{store_name}|{sku}|{stock}")
+    h = hashlib.blake2b(digest_size=16)
+    row_count = 0
+    for store_name, sku, stock in cursor:
+        h.update(f"{store_name}|{sku}|{stock}\n".encode())
+        row_count += 1
 
     conn.close()
-    return "\n".join(inventory_signature)
+    return h.hexdigest(), row_count
 
 
 print("=" * 70)
@@ -37,8 +75,7 @@ print("=" * 70)
 
 print("\n1. First generation already completed (retail.db)")
 print("   Getting inventory signature...")
-inv1_sig = get_inventory_hash(DB_FILE)
-inv1_count = len(inv1_sig.split("\n"))
+inv1_digest, inv1_count = get_inventory_hash(DB_FILE)
 print(f"   Inventory records: {inv1_count}")
 
 print("\n2. Generating second database (retail2.db)...")
@@ -47,55 +84,28 @@ print("\n2. Generating second database (retail2.db)...")
 if DB_FILE_2.exists():
     DB_FILE_2.unlink()
 
-# Run generator with different output file
-result = subprocess.run(
-    [
-        "bash",
-        "-c",
-        f"cd /workspace/new/app/data && PYTHONPATH=/workspace/new/app/data/src:/workspace/new/app/shared/src:$PYTHONPATH SQLITE_DB_FILE={DB_FILE_2} python3 src/zava_shop_datagenerator/__main__.py",
-    ],
-    capture_output=True,
-    text=True,
-)
-
-if result.returncode != 0:
-    print(f"   ❌ FAILED to generate second database")
-    print(result.stderr)
+# Run the generator in-process against the second output file
+try:
+    generate_database(DB_FILE_2)
+except (Exception, SystemExit) as e:
+    print(f"   ❌ FAILED to generate second database: {e}")
     sys.exit(1)
 
 print("   ✅ Second database generated")
 
 print("\n3. Getting inventory signature from second database...")
-inv2_sig = get_inventory_hash(DB_FILE_2)
-inv2_count = len(inv2_sig.split("\n"))
+inv2_digest, inv2_count = get_inventory_hash(DB_FILE_2)
 print(f"   Inventory records: {inv2_count}")
 
-print("\n4. Comparing inventory assignments...")
-if inv1_sig == inv2_sig:
+print("\n4. Comparing inventory digests...")
+if inv1_digest == inv2_digest:
     print("   ✅ PASS: Inventory assignments are IDENTICAL")
     print("   Both databases have exactly the same store-product assignments")
     print("   This confirms reproducibility!")
 else:
-    # Find differences
-    inv1_lines = set(inv1_sig.split("\n"))
-    inv2_lines = set(inv2_sig.split("\n"))
-
-    only_in_1 = inv1_lines - inv2_lines
-    only_in_2 = inv2_lines - inv1_lines
-
-    print(f"   ❌ FAIL: Inventory assignments DIFFER")
-    print(f"   Only in DB1: {len(only_in_1)} records")
-    print(f"   Only in DB2: {len(only_in_2)} records")
-
-    if only_in_1:
-        print(f"\n   First 5 differences in DB1:")
-        for line in list(only_in_1)[:5]:
-            print(f"     {line}")
-
-    if only_in_2:
-        print(f"\n   First 5 differences in DB2:")
-        for line in list(only_in_2)[:5]:
-            print(f"     {line}")
+    print("   ❌ FAIL: Inventory assignments DIFFER")
+    print(f"   DB1: {inv1_count} records, digest {inv1_digest}")
+    print(f"   DB2: {inv2_count} records, digest {inv2_digest}")
 
 print("\n" + "=" * 70)
 print("Note: Stock levels will differ (random 5-50), but SKU assignments")
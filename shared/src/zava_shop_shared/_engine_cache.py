@@ -0,0 +1,42 @@
+"""
+Process-wide cache of async SQLite engines shared by the providers.
+
+Creating an AsyncEngine pays for dialect setup, pool initialization and
+aiosqlite thread startup; when MCP servers instantiate providers per
+request that cost repeats on every call. Engines are cached by
+(url, readonly) and reference-counted so the pool is built once and only
+disposed when the last holder releases it.
+"""
+
+import logging
+from typing import Callable, Dict, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_engines: Dict[Tuple[str, bool], AsyncEngine] = {}
+_refcounts: Dict[Tuple[str, bool], int] = {}
+
+
+def acquire_engine(url: str, readonly: bool, factory: Callable[[], AsyncEngine]) -> AsyncEngine:
+    """Return the cached engine for (url, readonly), creating it on first use."""
+    key = (url, readonly)
+    if key not in _engines:
+        _engines[key] = factory()
+        logger.debug("Created shared async engine for %s (readonly=%s)", url, readonly)
+    _refcounts[key] = _refcounts.get(key, 0) + 1
+    return _engines[key]
+
+
+async def release_engine(url: str, readonly: bool) -> None:
+    """Drop one reference; dispose the engine when the last holder lets go."""
+    key = (url, readonly)
+    if key not in _engines:
+        return
+    _refcounts[key] -= 1
+    if _refcounts[key] <= 0:
+        engine = _engines.pop(key)
+        _refcounts.pop(key, None)
+        await engine.dispose()
+        logger.debug("Disposed shared async engine for %s (readonly=%s)", url, readonly)
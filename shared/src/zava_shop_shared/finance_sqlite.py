@@ -9,8 +9,11 @@ to support the Finance Agent MCP server using SQLite with SQLAlchemy ORM.
 import logging
 from typing import Optional
 
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from ._engine_cache import acquire_engine, release_engine
 from .config import Config
 
 logger = logging.getLogger(__name__)
@@ -39,23 +42,65 @@ class FinanceSQLiteProvider:
         """Async context manager exit."""
         await self.close_engine()
 
+    def _create_engine(self) -> AsyncEngine:
+        """Build the read-only engine with its connection pragmas."""
+        # Add read-only mode to SQLite connection. immutable=1 is
+        # deliberately not used: it would freeze the snapshot and hide
+        # WAL commits made by the inventory provider
+        readonly_url = self.sqlite_url
+        if "?" in readonly_url:
+            readonly_url += "&mode=ro"
+        else:
+            readonly_url += "?mode=ro"
+
+        # pool_pre_ping is skipped: a local file can't drop like a network
+        # database, and the ping costs a round trip per checkout. :memory:
+        # databases pin a StaticPool so the data survives across sessions.
+        if ":memory:" in self.sqlite_url:
+            pool_kwargs = {"poolclass": StaticPool}
+        else:
+            pool_kwargs = {"pool_size": 10, "max_overflow": 20}
+
+        engine = create_async_engine(
+            readonly_url,
+            connect_args={"timeout": 30, "check_same_thread": False},
+            echo=False,
+            **pool_kwargs,
+        )
+
+        if ":memory:" not in self.sqlite_url:
+
+            @event.listens_for(engine.sync_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+                # journal_mode is left alone: the writer (inventory
+                # provider) switches the shared file to WAL once, and
+                # a read-only connection cannot change it anyway
+                # aiosqlite's adapted cursor has no executescript, so the
+                # pragmas run as individual statements on the one cursor
+                cursor = dbapi_conn.cursor()
+                for pragma in (
+                    "PRAGMA busy_timeout=5000",
+                    "PRAGMA temp_store=MEMORY",
+                    "PRAGMA cache_size=-65536",
+                    # Belt-and-braces with mode=ro: rejects writes inside
+                    # SQLite even if the URL is ever built without it
+                    "PRAGMA query_only=1",
+                    # Serve warm reads from mmap'd pages instead of
+                    # pread() into the page cache (256 MiB window)
+                    "PRAGMA mmap_size=268435456",
+                ):
+                    cursor.execute(pragma)
+                cursor.close()
+
+        return engine
+
     async def open(self) -> None:
         """Open database connection and initialize async engine."""
         if self.engine is None:
             try:
-                # Add read-only mode to SQLite connection
-                readonly_url = self.sqlite_url
-                if "?" in readonly_url:
-                    readonly_url += "&mode=ro&immutable=1"
-                else:
-                    readonly_url += "?mode=ro&immutable=1"
-
-                self.engine = create_async_engine(
-                    readonly_url,
-                    connect_args={"timeout": 30, "check_same_thread": False},
-                    pool_pre_ping=True,
-                    echo=False,
-                )
+                # Engines are shared process-wide; providers pointing at the
+                # same database reuse one pool instead of rebuilding it
+                self.engine = acquire_engine(self.sqlite_url, readonly=True, factory=self._create_engine)
 
                 # Create async session factory
                 self.async_session_factory = async_sessionmaker(
@@ -70,9 +115,9 @@ class FinanceSQLiteProvider:
                 raise
 
     async def close_engine(self) -> None:
-        """Close async engine and cleanup."""
+        """Release this provider's reference to the shared engine."""
         if self.engine:
-            await self.engine.dispose()
+            await release_engine(self.sqlite_url, readonly=True)
             self.engine = None
             self.async_session_factory = None
             logger.info("✅ Finance SQLite async engine closed")
@@ -9,8 +9,11 @@ with READ-WRITE access to support stock transfers.
 import logging
 from typing import Optional
 
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from ._engine_cache import acquire_engine, release_engine
 from .config import Config
 
 logger = logging.getLogger(__name__)
@@ -39,17 +42,58 @@ class InventorySQLiteProvider:
         """Async context manager exit."""
         await self.close_engine()
 
+    def _create_engine(self) -> AsyncEngine:
+        """Build the read-write engine with its connection pragmas."""
+        # Note: No read-only mode for inventory server - it needs write access for transfers
+        # pool_pre_ping is skipped: a local file can't drop like a network
+        # database, and the ping costs a round trip per checkout. :memory:
+        # databases pin a StaticPool so the data survives across sessions.
+        if ":memory:" in self.sqlite_url:
+            pool_kwargs = {"poolclass": StaticPool}
+        else:
+            pool_kwargs = {"pool_size": 10, "max_overflow": 20}
+
+        # Modern SQLite allows 32766 bound parameters per statement, so
+        # bulk writes through this engine batch into large multi-row
+        # VALUES pages instead of the dialect's conservative default
+        engine = create_async_engine(
+            self.sqlite_url,
+            connect_args={"timeout": 30, "check_same_thread": False},
+            echo=False,
+            insertmanyvalues_page_size=2000,
+            **pool_kwargs,
+        )
+
+        if ":memory:" not in self.sqlite_url:
+
+            @event.listens_for(engine.sync_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+                # WAL lets finance readers proceed while a stock
+                # transfer is committing, instead of hitting
+                # "database is locked" under concurrent agent load
+                # aiosqlite's adapted cursor has no executescript, so the
+                # pragmas run as individual statements on the one cursor
+                cursor = dbapi_conn.cursor()
+                for pragma in (
+                    "PRAGMA journal_mode=WAL",
+                    "PRAGMA synchronous=NORMAL",
+                    "PRAGMA busy_timeout=5000",
+                    "PRAGMA temp_store=MEMORY",
+                    "PRAGMA cache_size=-65536",
+                    "PRAGMA mmap_size=268435456",
+                ):
+                    cursor.execute(pragma)
+                cursor.close()
+
+        return engine
+
     async def open_engine(self) -> None:
         """Open database connection and initialize async engine for READ-WRITE access."""
         if self.engine is None:
             try:
-                # Note: No read-only mode for inventory server - it needs write access for transfers
-                self.engine = create_async_engine(
-                    self.sqlite_url,
-                    connect_args={"timeout": 30, "check_same_thread": False},
-                    pool_pre_ping=True,
-                    echo=False,
-                )
+                # Engines are shared process-wide; providers pointing at the
+                # same database reuse one pool instead of rebuilding it
+                self.engine = acquire_engine(self.sqlite_url, readonly=False, factory=self._create_engine)
 
                 # Create async session factory
                 self.async_session_factory = async_sessionmaker(
@@ -64,9 +108,9 @@ class InventorySQLiteProvider:
                 raise
 
     async def close_engine(self) -> None:
-        """Close async engine and cleanup."""
+        """Release this provider's reference to the shared engine."""
         if self.engine:
-            await self.engine.dispose()
+            await release_engine(self.sqlite_url, readonly=False)
             self.engine = None
             self.async_session_factory = None
             logger.info("✅ Inventory SQLite async engine closed")
@@ -16,6 +16,7 @@ __all__ = [
     "Product",
     "ProductDescriptionEmbedding",
     "ProductImageEmbedding",
+    "decode_embedding",
     "ProductType",
     "Store",
     "Supplier",
@@ -31,7 +32,7 @@ from .customers import Customer
 from .inventory import Inventory
 from .order_items import OrderItem
 from .orders import Order
-from .product_embeddings import ProductDescriptionEmbedding, ProductImageEmbedding
+from .product_embeddings import ProductDescriptionEmbedding, ProductImageEmbedding, decode_embedding
 from .product_types import ProductType
 from .products import Product
 from .stores import Store
@@ -2,7 +2,7 @@
 Inventory model for SQLite
 """
 
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index, Integer, text
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -17,6 +17,15 @@ class Inventory(Base):
     product_id = Column(Integer, ForeignKey("products.product_id"), primary_key=True)
     stock_level = Column(Integer, nullable=False)
     
+    # Covering indexes: store/product for the JOIN lookups used by the MCP
+    # servers and validation tests, product/stock for the stock-level tool
+    # which filters by product and orders by stock_level DESC — both include
+    # stock_level so those queries never touch the table itself
+    __table_args__ = (
+        Index("ix_inventory_store_product", "store_id", "product_id", "stock_level"),
+        Index("ix_inventory_product_stock", "product_id", text("stock_level DESC")),
+    )
+
     # Relationships
     store = relationship("Store", back_populates="inventory")
     product = relationship("Product", back_populates="inventory")
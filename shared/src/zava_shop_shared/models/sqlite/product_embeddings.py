@@ -2,19 +2,40 @@
 Product embedding models for SQLite
 """
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, func
+import numpy as np
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, String, func
 from sqlalchemy.orm import relationship
 
 from .base import Base
 
 
+def decode_embedding(blob, scale=None) -> np.ndarray:
+    """Decode a stored embedding into a float32 vector
+
+    Embeddings are packed little-endian float32 bytes; np.frombuffer
+    returns a read-only view straight over the blob, so no per-float
+    Python objects are created. Databases that quantize to int8 (the
+    generator's product_description_embeddings table) store a per-vector
+    embedding_scale - pass it and the blob is reconstructed as
+    int8 * scale in one vectorized multiply. Legacy JSON-text rows
+    (leading '[') are still handled during migration.
+    """
+    if isinstance(blob, str) or blob[:1] == b"[":
+        import json
+
+        return np.asarray(json.loads(blob), dtype=np.float32)
+    if scale is not None:
+        return np.frombuffer(blob, dtype=np.int8).astype(np.float32) * np.float32(scale)
+    return np.frombuffer(blob, dtype="<f4")
+
+
 class ProductImageEmbedding(Base):
-    """Stores image embeddings for products as JSON strings"""
+    """Stores image embeddings for products as packed float32 bytes"""
 
     __tablename__ = "product_image_embeddings"
 
     product_id = Column(Integer, ForeignKey("products.product_id"), primary_key=True)
-    image_embedding = Column(Text, nullable=False)  # JSON string of embedding vector
+    image_embedding = Column(LargeBinary, nullable=False)  # little-endian float32 bytes
     created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
@@ -25,12 +46,12 @@ class ProductImageEmbedding(Base):
 
 
 class ProductDescriptionEmbedding(Base):
-    """Stores description embeddings for products as JSON strings"""
+    """Stores description embeddings for products as packed float32 bytes"""
 
     __tablename__ = "product_description_embeddings"
 
     product_id = Column(Integer, ForeignKey("products.product_id"), primary_key=True)
-    description_embedding = Column(Text, nullable=False)  # JSON string of embedding vector
+    description_embedding = Column(LargeBinary, nullable=False)  # little-endian float32 bytes
     created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
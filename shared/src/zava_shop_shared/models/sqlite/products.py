@@ -2,7 +2,7 @@
 Product model for SQLite
 """
 
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -28,6 +28,12 @@ class Product(Base):
     discontinued = Column(Boolean, default=False)
     image_url = Column(String, nullable=True)
 
+    # Foreign-key lookup indexes for supplier and category/type JOINs
+    __table_args__ = (
+        Index("ix_products_supplier", "supplier_id"),
+        Index("ix_products_category_type", "category_id", "type_id"),
+    )
+
     # Relationships
     category = relationship("Category", back_populates="products")
     product_type = relationship("ProductType", back_populates="products")
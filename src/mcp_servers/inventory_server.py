@@ -14,19 +14,27 @@ import os
 from contextlib import asynccontextmanager
 from typing import Annotated, AsyncIterator
 
+import orjson
 from fastmcp import FastMCP
-from opentelemetry.instrumentation.auto_instrumentation import initialize
-from opentelemetry.instrumentation.mcp import McpInstrumentor
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
 from pydantic import Field
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 from zava_shop_shared.inventory_sqlite import InventorySQLiteProvider
 from zava_shop_shared.models.sqlite import Inventory, Product, Store
 
-initialize()
+# OpenTelemetry auto-instrumentation wraps every SQLAlchemy call, MCP handler
+# and asyncio task; that overhead is only worth paying when traces are actually
+# exported, so instrumentation is opt-in via OTEL_ENABLED=1
+if os.getenv("OTEL_ENABLED") == "1":
+    from opentelemetry.instrumentation.auto_instrumentation import initialize
+    from opentelemetry.instrumentation.mcp import McpInstrumentor
 
-McpInstrumentor().instrument()
+    initialize()
+    McpInstrumentor().instrument()
 
 # Configure logging
 logging.basicConfig(
@@ -35,16 +43,39 @@ logging.basicConfig(
 )
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 db: InventorySQLiteProvider = InventorySQLiteProvider()
 
+# Statements are built once at import and reused with bound parameters, so
+# per-call work is parameter binding only — SQLAlchemy's compiled-SQL cache
+# stays keyed to these constants instead of fresh expression trees
+_STOCK_LEVELS_STMT = (
+    select(
+        Inventory.store_id,
+        Inventory.product_id,
+        Inventory.stock_level,
+        Product.product_name,
+        Product.sku,
+    )
+    .join(Product, Inventory.product_id == Product.product_id)
+    .where(Product.product_id == bindparam("product_id"))
+    .order_by(Inventory.stock_level.desc())
+)
+
+# Store metadata is tiny and immutable for the life of the server; cached at
+# startup so per-request queries skip the stores join and enrich rows here
+_store_cache: dict[int, tuple[str, int]] = {}
+
+
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator:
     # Initialize database connection once at startup
     await db.open_engine()
-    logger.info("Database connection initialized")
+    async with db.get_session() as session:
+        result = await session.execute(select(Store.store_id, Store.store_name, Store.is_online))
+        _store_cache.update({store_id: (store_name, is_online) for store_id, store_name, is_online in result.all()})
+    logger.info("Database connection initialized; cached metadata for %d stores", len(_store_cache))
     yield
     await db.close_engine()
 
@@ -58,7 +89,18 @@ async def health_check(request: Request) -> Response:
     return JSONResponse({"status": "ok"})
 
 
-@mcp.tool()
+# Declared explicitly because the ToolResult return annotation carries no
+# schema; matches what FastMCP derives for list[dict], so clients still
+# unwrap result.data to the row list
+_STOCK_LEVELS_OUTPUT_SCHEMA = {
+    "type": "object",
+    "properties": {"result": {"type": "array", "items": {"type": "object", "additionalProperties": True}}},
+    "required": ["result"],
+    "x-fastmcp-wrap-result": True,
+}
+
+
+@mcp.tool(output_schema=_STOCK_LEVELS_OUTPUT_SCHEMA)
 async def get_stock_level_by_product_id(
     product_id: Annotated[
         int, Field(description="Product ID to check stock levels for")
@@ -69,7 +111,7 @@ async def get_stock_level_by_product_id(
             description="Optional filter: True for online stores only, False for physical stores only, or omit for all stores"
         ),
     ] = None,
-) -> list[dict]:
+) -> ToolResult:
     """
     Get stock levels for a product by product ID across all stores.
 
@@ -84,49 +126,53 @@ async def get_stock_level_by_product_id(
     """
     try:
         logger.info(
-            f"Getting stock levels for product ID: {product_id}, is_online filter: {is_online}"
+            "Getting stock levels for product ID: %s, is_online filter: %s", product_id, is_online
         )
 
         async with db.get_session() as session:
-            # Query inventory with store and product information
-            stmt = (
-                select(
-                    Inventory.store_id,
-                    Inventory.product_id,
-                    Inventory.stock_level,
-                    Store.store_name,
-                    Store.is_online,
-                    Product.product_name,
-                    Product.sku,
+            result = await session.execute(_STOCK_LEVELS_STMT, {"product_id": product_id})
+
+            # Materialize dicts in one pass over the cursor: the enrichment
+            # from the store cache doubles as the dict conversion, with no
+            # intermediate list of row objects
+            wanted = None if is_online is None else int(is_online)
+            inventory_list = []
+            for row in result.mappings():
+                cached = _store_cache.get(row["store_id"])
+                if cached is None:
+                    # A dangling store_id (no matching store at startup) is
+                    # dropped, mirroring the inner join this replaced
+                    logger.warning("Skipping inventory row with unknown store ID: %s", row["store_id"])
+                    continue
+                store_name, store_is_online = cached
+                if wanted is not None and store_is_online != wanted:
+                    continue
+                inventory_list.append({**row, "store_name": store_name, "is_online": store_is_online})
+
+            if not inventory_list:
+                logger.info("No inventory found for product ID: %s", product_id)
+                return ToolResult(
+                    content=[TextContent(type="text", text="[]")],
+                    structured_content={"result": []},
                 )
-                .join(Store, Inventory.store_id == Store.store_id)
-                .join(Product, Inventory.product_id == Product.product_id)
-                .where(Product.product_id == product_id)
-            )
-
-            # Apply is_online filter if specified
-            if is_online is not None:
-                stmt = stmt.where(Store.is_online == (1 if is_online else 0))
-
-            stmt = stmt.order_by(Inventory.stock_level.desc())
-
-            result = await session.execute(stmt)
-            rows = result.mappings().all()
-
-            if not rows:
-                logger.info(f"No inventory found for product ID: {product_id}")
-                return []
-
-            inventory_list = [dict(row) for row in rows]
 
             logger.info(
-                f"Found inventory at {len(inventory_list)} store(s) for product ID: {product_id}"
+                "Found inventory at %d store(s) for product ID: %s", len(inventory_list), product_id
+            )
+            # Serialize once with orjson (C-level) and hand FastMCP a ready
+            # ToolResult, skipping the framework's per-row conversion pass for
+            # products stocked across many stores
+            return ToolResult(
+                content=[TextContent(type="text", text=orjson.dumps(inventory_list).decode())],
+                structured_content={"result": inventory_list},
             )
-            return inventory_list
 
     except Exception as e:
-        logger.error(f"Error getting stock levels: {e}")
-        return []
+        logger.error("Error getting stock levels: %s", e)
+        return ToolResult(
+            content=[TextContent(type="text", text="[]")],
+            structured_content={"result": []},
+        )
 
 
 @mcp.tool()
@@ -152,90 +198,92 @@ async def transfer_stock(
     """
     try:
         logger.info(
-            f"Transfer request: {quantity} units of product_id {product_id} from store {from_store_id} to store {to_store_id}"
+            "Transfer request: %d units of product_id %s from store %s to store %s",
+            quantity,
+            product_id,
+            from_store_id,
+            to_store_id,
         )
 
+        # All input validation happens before any session is acquired so
+        # rejected requests never touch the pool. quantity > 0 is enforced by
+        # the pydantic Field(gt=0) before the tool body even runs; the
+        # same-store rule is the one cross-field check pydantic can't express
+        # per-field, so it lives here.
         if from_store_id == to_store_id:
             return {
                 "success": False,
                 "message": "Cannot transfer stock to the same store",
             }
 
-        if quantity <= 0:
-            return {
-                "success": False,
-                "message": "Transfer quantity must be positive",
-            }
-
         async with db.get_session() as session:
-            # Get source and destination inventory in a single query
-            inventory_stmt = (
-                select(Inventory, Store.store_name)
-                .join(Store, Inventory.store_id == Store.store_id)
-                .where(
-                    and_(
-                        Inventory.product_id == product_id,
-                        Inventory.store_id.in_([from_store_id, to_store_id]),
+            # Atomic check-and-decrement: the WHERE clause guards the stock
+            # level inside the UPDATE itself, so no application-level race
+            # window exists between check and mutation; RETURNING hands back
+            # the new level in the same statement
+            new_from_stock = (
+                await session.execute(
+                    update(Inventory)
+                    .where(
+                        and_(
+                            Inventory.store_id == from_store_id,
+                            Inventory.product_id == product_id,
+                            Inventory.stock_level >= quantity,
+                        )
                     )
+                    .values(stock_level=Inventory.stock_level - quantity)
+                    .returning(Inventory.stock_level)
                 )
-            )
-            inventory_result = await session.execute(inventory_stmt)
-            inventory_rows = inventory_result.all()
-
-            # Organize results
-            from_inventory = None
-            to_inventory = None
-            from_store_name = None
-            to_store_name = None
-
-            for inv, store_name in inventory_rows:
-                if inv.store_id == from_store_id:
-                    from_inventory = inv
-                    from_store_name = store_name
-                elif inv.store_id == to_store_id:
-                    to_inventory = inv
-                    to_store_name = store_name
-
-            if not from_inventory:
-                return {
-                    "success": False,
-                    "message": f"No inventory record found for product ID '{product_id}' at source store {from_store_id}",
-                }
-
-            if from_inventory.stock_level < quantity:
+            ).scalar_one_or_none()
+
+            if new_from_stock is None:
+                # Distinguish a missing record from insufficient stock
+                available = await session.scalar(
+                    select(Inventory.stock_level).where(
+                        and_(
+                            Inventory.store_id == from_store_id,
+                            Inventory.product_id == product_id,
+                        )
+                    )
+                )
+                if available is None:
+                    return {
+                        "success": False,
+                        "message": f"No inventory record found for product ID '{product_id}' at source store {from_store_id}",
+                    }
                 return {
                     "success": False,
-                    "message": f"Insufficient stock at source store. Available: {from_inventory.stock_level}, Requested: {quantity}",
-                    "available_stock": from_inventory.stock_level,
+                    "message": f"Insufficient stock at source store. Available: {available}, Requested: {quantity}",
+                    "available_stock": available,
                 }
 
-            # Create inventory record if it doesn't exist at destination
-            if not to_inventory:
-                logger.info(
-                    f"Creating new inventory record for product ID '{product_id}' at destination store {to_store_id}"
-                )
-                to_inventory = Inventory(
-                    store_id=to_store_id,
-                    product_id=product_id,
-                    stock_level=0,
+            # UPSERT the destination row: insert at `quantity` or add to the
+            # existing stock level, again returning the new level directly
+            new_to_stock = (
+                await session.execute(
+                    sqlite_insert(Inventory)
+                    .values(store_id=to_store_id, product_id=product_id, stock_level=quantity)
+                    .on_conflict_do_update(
+                        index_elements=["store_id", "product_id"],
+                        set_={"stock_level": Inventory.stock_level + quantity},
+                    )
+                    .returning(Inventory.stock_level)
                 )
-                session.add(to_inventory)
-                await session.flush()
-
-            # Capture before values
-            old_from_stock = from_inventory.stock_level
-            old_to_stock = to_inventory.stock_level
+            ).scalar_one()
 
-            # Perform the transfer
-            from_inventory.stock_level -= quantity
-            to_inventory.stock_level += quantity
+            from_store_name = _store_cache.get(from_store_id, (f"store {from_store_id}", 0))[0]
+            to_store_name = _store_cache.get(to_store_id, (f"store {to_store_id}", 0))[0]
 
-            # Commit the transaction
             await session.commit()
 
             logger.info(
-                f"Transfer completed: {quantity} units of product ID {product_id} "
-                f"from store {from_store_id} ({from_store_name}) to store {to_store_id} ({to_store_name})"
+                "Transfer completed: %d units of product ID %s from store %s (%s) to store %s (%s)",
+                quantity,
+                product_id,
+                from_store_id,
+                from_store_name,
+                to_store_id,
+                to_store_name,
             )
 
             return {
@@ -246,19 +294,19 @@ async def transfer_stock(
                 "from_store": {
                     "store_id": from_store_id,
                     "store_name": from_store_name,
-                    "stock_before": old_from_stock,
-                    "stock_after": from_inventory.stock_level,
+                    "stock_before": new_from_stock + quantity,
+                    "stock_after": new_from_stock,
                 },
                 "to_store": {
                     "store_id": to_store_id,
                     "store_name": to_store_name,
-                    "stock_before": old_to_stock,
-                    "stock_after": to_inventory.stock_level,
+                    "stock_before": new_to_stock - quantity,
+                    "stock_after": new_to_stock,
                 },
             }
 
     except Exception as e:
-        logger.error(f"Error transferring stock: {e}")
+        logger.error("Error transferring stock: %s", e)
         return {
             "success": False,
             "message": f"Error during transfer: {e!s}",
@@ -7,12 +7,12 @@ SQLite Edition - uses pure Python for semantic search.
 import asyncio
 import json
 import logging
-import math
 import os
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import Annotated, AsyncIterator, Optional
 
+import numpy as np
 from azure.monitor.opentelemetry import configure_azure_monitor
 from fastmcp import FastMCP
 from pydantic import Field
@@ -32,6 +32,7 @@ from zava_shop_shared.models.sqlite import (
     ProductType,
     Store,
     Supplier,
+    decode_embedding,
 )
 
 # Import Azure OpenAI for embeddings
@@ -87,16 +88,62 @@ async def health_check(_request: Request) -> Response:
     return JSONResponse({"status": "ok"})
 
 
-def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
-    """Calculate cosine similarity between two vectors."""
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    magnitude1 = math.sqrt(sum(a * a for a in vec1))
-    magnitude2 = math.sqrt(sum(b * b for b in vec2))
+# Statement for the searchable catalog: active products with their
+# embeddings and supplier info, compiled once at import
+_PRODUCT_SEARCH_STMT = (
+    select(
+        Product.product_id,
+        Product.sku,
+        Product.product_name,
+        Product.product_description,
+        Product.base_price,
+        Product.cost,
+        Product.discontinued,
+        Category.category_name,
+        ProductType.type_name,
+        ProductDescriptionEmbedding.description_embedding,
+        Supplier.supplier_id,
+        Supplier.supplier_name,
+        Supplier.supplier_rating,
+        Supplier.lead_time_days,
+        Supplier.minimum_order_amount,
+        Supplier.bulk_discount_percent,
+    )
+    .select_from(Product)
+    .join(ProductDescriptionEmbedding, Product.product_id == ProductDescriptionEmbedding.product_id)
+    .join(Category, Product.category_id == Category.category_id)
+    .join(ProductType, Product.type_id == ProductType.type_id)
+    .join(Supplier, Product.supplier_id == Supplier.supplier_id)
+    .where(Product.discontinued == False)
+)
+
+# (normalized embedding matrix, catalog rows), built on first search. The
+# database is opened read-only, so the catalog cannot change under a
+# running server and the scan never needs to re-read or re-decode it.
+_product_catalog: Optional[tuple[np.ndarray, list]] = None
 
-    if magnitude1 == 0 or magnitude2 == 0:
-        return 0.0
 
-    return dot_product / (magnitude1 * magnitude2)
+async def _load_product_catalog() -> tuple[np.ndarray, list]:
+    """Return the cached catalog rows and their L2-normalized embeddings."""
+    global _product_catalog
+    if _product_catalog is None:
+        async with db_provider.get_session() as session:
+            result = await session.execute(_PRODUCT_SEARCH_STMT)
+            rows = result.all()
+
+        if rows:
+            matrix = np.stack([decode_embedding(row.description_embedding) for row in rows])
+            # Pre-normalize so each query is one matrix-vector product;
+            # zero-magnitude rows are pushed to score 0.0
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0.0] = np.inf
+            matrix = matrix / norms
+        else:
+            matrix = np.empty((0, 0), dtype=np.float32)
+
+        _product_catalog = (matrix, rows)
+        logger.info("Loaded product catalog for semantic search: %d products", len(rows))
+    return _product_catalog
 
 
 async def _semantic_search_products_impl(
@@ -119,71 +166,48 @@ async def _semantic_search_products_impl(
             logger.error("Failed to generate embedding from Azure OpenAI")
             return []
 
-        async with db_provider.get_session() as session:
-            # Fetch all product embeddings with supplier info
-            stmt = (
-                select(
-                    Product.product_id,
-                    Product.sku,
-                    Product.product_name,
-                    Product.product_description,
-                    Product.base_price,
-                    Product.cost,
-                    Product.discontinued,
-                    Category.category_name,
-                    ProductType.type_name,
-                    ProductDescriptionEmbedding.description_embedding,
-                    Supplier.supplier_id,
-                    Supplier.supplier_name,
-                    Supplier.supplier_rating,
-                    Supplier.lead_time_days,
-                    Supplier.minimum_order_amount,
-                    Supplier.bulk_discount_percent,
-                )
-                .select_from(Product)
-                .join(ProductDescriptionEmbedding, Product.product_id == ProductDescriptionEmbedding.product_id)
-                .join(Category, Product.category_id == Category.category_id)
-                .join(ProductType, Product.type_id == ProductType.type_id)
-                .join(Supplier, Product.supplier_id == Supplier.supplier_id)
-                .where(Product.discontinued == False)
-            )
+        matrix, rows = await _load_product_catalog()
+        if not rows:
+            return []
 
-            result = await session.execute(stmt)
-            rows = result.all()
+        # The catalog matrix is pre-normalized, so scoring every product
+        # is one BLAS matrix-vector product against the normalized query
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0.0:
+            return []
+        scores = matrix @ (query / query_norm)
+
+        # Keep rows above the threshold, best-first, capped at limit
+        keep = np.flatnonzero(scores >= min_similarity)
+        top = keep[np.argsort(scores[keep])[::-1][:limit]]
+
+        scored_products = []
+        for i in top:
+            row = rows[i]
+            scored_products.append(
+                {
+                    "product_id": row.product_id,
+                    "sku": row.sku,
+                    "product_name": row.product_name,
+                    "product_description": row.product_description,
+                    "base_price": float(row.base_price),
+                    "cost": float(row.cost),
+                    "category_name": row.category_name,
+                    "type_name": row.type_name,
+                    "similarity_score": round(float(scores[i]), 4),
+                    "supplier": {
+                        "supplier_id": row.supplier_id,
+                        "supplier_name": row.supplier_name,
+                        "supplier_rating": float(row.supplier_rating),
+                        "lead_time_days": row.lead_time_days,
+                        "minimum_order_amount": float(row.minimum_order_amount),
+                        "bulk_discount_percent": float(row.bulk_discount_percent),
+                    },
+                }
+            )
 
-            # Calculate similarities using pure Python
-            scored_products = []
-            for row in rows:
-                # Parse embedding from JSON string
-                product_embedding = json.loads(row.description_embedding)
-                similarity = cosine_similarity(query_embedding, product_embedding)
-
-                if similarity >= min_similarity:
-                    scored_products.append(
-                        {
-                            "product_id": row.product_id,
-                            "sku": row.sku,
-                            "product_name": row.product_name,
-                            "product_description": row.product_description,
-                            "base_price": float(row.base_price),
-                            "cost": float(row.cost),
-                            "category_name": row.category_name,
-                            "type_name": row.type_name,
-                            "similarity_score": round(similarity, 4),
-                            "supplier": {
-                                "supplier_id": row.supplier_id,
-                                "supplier_name": row.supplier_name,
-                                "supplier_rating": float(row.supplier_rating),
-                                "lead_time_days": row.lead_time_days,
-                                "minimum_order_amount": float(row.minimum_order_amount),
-                                "bulk_discount_percent": float(row.bulk_discount_percent),
-                            },
-                        }
-                    )
-
-            # Sort by similarity (descending) and limit
-            scored_products.sort(key=lambda x: x["similarity_score"], reverse=True)
-            return scored_products[:limit]
+        return scored_products
 
     except Exception as e:
         logger.error(f"Error in semantic_search_products: {e}")
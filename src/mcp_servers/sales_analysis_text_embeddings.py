@@ -36,6 +36,11 @@ class SemanticSearchTextEmbedding:
         # Load environment variables
         self._load_environment()
 
+        # Cache of query text -> embedding tuple. Test suites and agents
+        # re-ask the same literal queries; a hit skips a remote API call.
+        self._query_cache: dict[str, tuple[float, ...]] = {}
+        self._query_cache_max = 256
+
         # Azure OpenAI configuration
         self.endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
         self.api_key = os.getenv("AZURE_OPENAI_KEY")
@@ -105,6 +110,11 @@ class SemanticSearchTextEmbedding:
             )
             return None
 
+        cached = self._query_cache.get(query_text)
+        if cached is not None:
+            logger.debug("Embedding cache hit for query: '%s'", query_text)
+            return list(cached)
+
         try:
             logger.info("Generating embedding for query: '%s'", query_text)
 
@@ -116,12 +126,64 @@ class SemanticSearchTextEmbedding:
             # Extract embedding from response
             embedding = response.data[0].embedding
             logger.info("✓ Generated embedding (dimension: %d)", len(embedding))
+            self._cache_embedding(query_text, embedding)
             return embedding
 
         except Exception as e:
             logger.error("Error generating embedding: %s", e)
             return None
 
+    def generate_query_embeddings(
+        self, query_texts: List[str]
+    ) -> Optional[List[Optional[List[float]]]]:
+        """
+        Generate embeddings for several query texts in one API request.
+
+        The embeddings endpoint accepts a list input, so N distinct queries
+        cost a single HTTP round trip instead of N. Texts already in the
+        cache are not re-sent; results are returned in input order.
+
+        Args:
+            query_texts: The query strings to embed
+
+        Returns:
+            One embedding per input text (in order), or None if the batch
+            request itself failed
+        """
+        if not self.openai_client:
+            logger.error(
+                "Azure OpenAI client not initialized. Cannot generate embeddings."
+            )
+            return None
+
+        missing = [text for text in dict.fromkeys(query_texts) if text not in self._query_cache]
+        if missing:
+            try:
+                logger.info("Generating embeddings for %d queries in one batch", len(missing))
+                response = self.openai_client.embeddings.create(
+                    input=missing, model=self.deployment
+                )
+                for text, item in zip(missing, response.data):
+                    self._cache_embedding(text, item.embedding)
+            except Exception as e:
+                logger.error("Error generating batch embeddings: %s", e)
+                return None
+
+        return [
+            list(cached) if (cached := self._query_cache.get(text)) is not None else None
+            for text in query_texts
+        ]
+
+    def _cache_embedding(self, query_text: str, embedding: List[float]) -> None:
+        """Remember a successful embedding, evicting the oldest entry when full.
+
+        Only successes are cached so a transient API failure is retried on
+        the next call rather than pinned as a miss.
+        """
+        if len(self._query_cache) >= self._query_cache_max:
+            self._query_cache.pop(next(iter(self._query_cache)))
+        self._query_cache[query_text] = tuple(embedding)
+
     def is_available(self) -> bool:
         """Check if the semantic search functionality is available."""
         return self.openai_client is not None
@@ -6,94 +6,134 @@ Tests Inventory and Sales Analysis servers.
 
 import asyncio
 import sys
-import warnings
+from contextlib import AsyncExitStack
 
+import pytest
 from fastmcp.client import Client
 
 from mcp_servers.inventory_server import mcp as inventory_mcp
 from mcp_servers.sales_analysis import mcp as sales_analysis_mcp
 
-# Suppress CancelledError warnings during cleanup
-warnings.filterwarnings("ignore", category=RuntimeWarning, message=".*was never awaited.*")
+# Separator lines built once instead of per print call
+SEP70 = "=" * 70
 
 
-async def test_inventory_server():
-    """Test Inventory MCP server."""
+async def _check_inventory_server(client: Client) -> None:
+    """Exercise the Inventory MCP server tools over a connected client."""
     print("\n🧪 Testing Inventory MCP Server...")
 
-    async with Client(inventory_mcp) as client:
-        # Test get_stock_level_by_product_id
-        result = await client.call_tool(name="get_stock_level_by_product_id", arguments={"product_id": 1})
-        assert result.data is not None
-        print("  ✅ get_stock_level_by_product_id tool")
+    # Test get_stock_level_by_product_id
+    result = await client.call_tool(name="get_stock_level_by_product_id", arguments={"product_id": 1})
+    assert result.data is not None
+    print("  ✅ get_stock_level_by_product_id tool")
 
-        # Test transfer_stock (small test transfer)
-        result = await client.call_tool(
-            name="transfer_stock", arguments={"from_store_id": 1, "to_store_id": 2, "product_id": 1, "quantity": 1}
-        )
-        assert result.data is not None
-        print("  ✅ transfer_stock tool")
+    # Test transfer_stock (small test transfer)
+    result = await client.call_tool(
+        name="transfer_stock", arguments={"from_store_id": 1, "to_store_id": 2, "product_id": 1, "quantity": 1}
+    )
+    assert result.data is not None
+    print("  ✅ transfer_stock tool")
 
 
-async def test_sales_analysis_server():
-    """Test Sales Analysis MCP server."""
+async def _check_sales_analysis_server(client: Client) -> None:
+    """Exercise the Sales Analysis MCP server tools over a connected client."""
     print("\n🧪 Testing Sales Analysis MCP Server...")
 
-    async with Client(sales_analysis_mcp) as client:
-        # Test get_database_schema
-        result = await client.call_tool(name="get_database_schema", arguments={})
-        assert result.data is not None
-        print("  ✅ get_database_schema tool")
+    # Test get_database_schema
+    result = await client.call_tool(name="get_database_schema", arguments={})
+    assert result.data is not None
+    print("  ✅ get_database_schema tool")
+
+    # Test semantic_search_products
+    result = await client.call_tool(
+        name="semantic_search_products", arguments={"query_description": "cordless drill battery", "limit": 5}
+    )
+    assert result.data is not None
+    print("  ✅ semantic_search_products tool")
+
+    # Test execute_sales_query
+    result = await client.call_tool(
+        name="execute_sales_query", arguments={"sql_query": "SELECT store_name FROM stores LIMIT 5"}
+    )
+    assert result.data is not None
+    print("  ✅ execute_sales_query tool")
+
+    # Test get_current_utc_date
+    result = await client.call_tool(name="get_current_utc_date", arguments={})
+    assert result.data is not None
+    print("  ✅ get_current_utc_date tool")
+
+
+# Pytest entry points reuse the session-scoped clients from conftest.py so
+# each in-process server starts once per run, not once per test
+@pytest.mark.asyncio(loop_scope="session")
+async def test_inventory_server(inventory_client):
+    """Test Inventory MCP server."""
+    await _check_inventory_server(inventory_client)
 
-        # Test semantic_search_products
-        result = await client.call_tool(
-            name="semantic_search_products", arguments={"query_description": "cordless drill battery", "limit": 5}
-        )
-        assert result.data is not None
-        print("  ✅ semantic_search_products tool")
 
-        # Test execute_sales_query
-        result = await client.call_tool(
-            name="execute_sales_query", arguments={"sql_query": "SELECT store_name FROM stores LIMIT 5"}
-        )
-        assert result.data is not None
-        print("  ✅ execute_sales_query tool")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sales_analysis_server(sales_analysis_client):
+    """Test Sales Analysis MCP server."""
+    await _check_sales_analysis_server(sales_analysis_client)
+
 
-        # Test get_current_utc_date
-        result = await client.call_tool(name="get_current_utc_date", arguments={})
-        assert result.data is not None
-        print("  ✅ get_current_utc_date tool")
+# Server registry for the script driver; only the servers actually selected
+# have a client brought up at all
+_SERVERS = {
+    "inventory": (inventory_mcp, _check_inventory_server),
+    "sales": (sales_analysis_mcp, _check_sales_analysis_server),
+}
 
 
-async def main():
-    """Run all E2E tests."""
-    print("=" * 70)
-    print("🚀 E2E Tests for All MCP Servers (using FastMCP Client)")
-    print("=" * 70)
+async def main(selected: set[str] | None = None):
+    """Run E2E tests for the selected servers (default: all)."""
+    if selected is None:
+        selected = set(_SERVERS)
+    unknown = selected - set(_SERVERS)
+    if unknown:
+        raise SystemExit(f"Unknown server(s): {', '.join(sorted(unknown))}. Choose from: {', '.join(_SERVERS)}")
+
+    # Banner blocks go out as one write each rather than one syscall per line
+    sys.stdout.write(
+        f"{SEP70}\n🚀 E2E Tests for MCP Servers: {', '.join(sorted(selected))} (using FastMCP Client)\n{SEP70}\n"
+    )
 
     success = False
     try:
-        await test_inventory_server()
-        await test_sales_analysis_server()
-
-        print("\n" + "=" * 70)
-        print("✅ ALL E2E TESTS PASSED!")
-        print("\nTested MCP Servers:")
-        print("  • Inventory Server: 2 tools tested")
-        print("  • Sales Analysis Server: 4 tools tested")
-        print("\nAll servers working correctly with Zava Retail database!")
-        print("=" * 70)
+        # Enter only the selected clients, once each, and keep them open for
+        # the whole run so each server pays a single session handshake. The
+        # servers are independent, so their checks run as a TaskGroup:
+        # concurrent, with siblings cancelled on the first failure.
+        async with AsyncExitStack() as stack:
+            async with asyncio.TaskGroup() as tg:
+                for name in sorted(selected):
+                    server_mcp, check = _SERVERS[name]
+                    client = await stack.enter_async_context(Client(server_mcp))
+                    tg.create_task(check(client))
+
+        sys.stdout.write(
+            f"\n{SEP70}\n"
+            "✅ ALL E2E TESTS PASSED!\n"
+            "\nTested MCP Servers:\n"
+            "  • Inventory Server: 2 tools tested\n"
+            "  • Sales Analysis Server: 4 tools tested\n"
+            "\nAll servers working correctly with Zava Retail database!\n"
+            f"{SEP70}\n"
+        )
         success = True
 
-    except Exception as e:
-        print(f"\n❌ TEST FAILED: {e}")
+    except* Exception as eg:
         import traceback
 
-        traceback.print_exc()
+        for e in eg.exceptions:
+            print(f"\n❌ TEST FAILED: {e}")
+            traceback.print_exception(e)
 
     return success
 
 
 if __name__ == "__main__":
-    result = asyncio.run(main())
+    args = set(sys.argv[1:]) or None
+    result = asyncio.run(main(args))
     sys.exit(0 if result else 1)
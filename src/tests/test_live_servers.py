@@ -8,179 +8,182 @@ import asyncio
 import sys
 
 from mcp import ClientSession, StdioServerParameters
-from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
 
+# Separator lines built once instead of per print call
+SEP80 = "=" * 80
 
-async def test_finance_server():
+
+async def test_finance_server(out: list[str]):
     """Test Finance MCP server via HTTP."""
-    print("=" * 80)
-    print("Testing Finance MCP Server (http://localhost:8001/mcp)")
-    print("=" * 80)
+    out.append(SEP80)
+    out.append("Testing Finance MCP Server (http://localhost:8001/mcp)")
+    out.append(SEP80)
 
     server_url = "http://localhost:8001/mcp"
 
-    async with sse_client(server_url) as (read, write):
+    async with streamablehttp_client(server_url) as (read, write, _):
         async with ClientSession(read, write) as session:
             await session.initialize()
 
             # List available tools
             tools_response = await session.list_tools()
-            print(f"\n✅ Connected! Found {len(tools_response.tools)} tools:")
+            out.append(f"\n✅ Connected! Found {len(tools_response.tools)} tools:")
             for tool in tools_response.tools:
-                print(f"   - {tool.name}")
-
-            # Test get_stores
-            print("\n📋 Testing get_stores()...")
-            result = await session.call_tool("get_stores", arguments={"store_name": ""})
-            stores_data = result.content[0].text
-            print(f"✅ get_stores() - Retrieved data (first 200 chars): {stores_data[:200]}...")
-
-            # Test get_historical_sales_data
-            print("\n📊 Testing get_historical_sales_data()...")
-            result = await session.call_tool(
-                "get_historical_sales_data", arguments={"days_back": 30, "store_id": 1, "category_name": "POWER TOOLS"}
+                out.append(f"   - {tool.name}")
+
+            # The three tools are independent, so issue them together and let
+            # the round-trips overlap instead of paying one RTT per call
+            out.append("\n📋 Testing get_stores, get_historical_sales_data, get_current_inventory_status...")
+            stores_res, sales_res, inv_res = await asyncio.gather(
+                session.call_tool("get_stores", arguments={"store_name": ""}),
+                session.call_tool(
+                    "get_historical_sales_data",
+                    arguments={"days_back": 30, "store_id": 1, "category_name": "POWER TOOLS"},
+                ),
+                session.call_tool(
+                    "get_current_inventory_status",
+                    arguments={"store_id": 1, "category_name": "HARDWARE", "low_stock_threshold": 10},
+                ),
+            )
+            out.append(f"✅ get_stores() - Retrieved data (first 200 chars): {stores_res.content[0].text[:200]}...")
+            out.append(
+                f"✅ get_historical_sales_data() - Retrieved data (first 200 chars): {sales_res.content[0].text[:200]}..."
             )
-            sales_data = result.content[0].text
-            print(f"✅ get_historical_sales_data() - Retrieved data (first 200 chars): {sales_data[:200]}...")
-
-            # Test get_current_inventory_status
-            print("\n📦 Testing get_current_inventory_status()...")
-            result = await session.call_tool(
-                "get_current_inventory_status",
-                arguments={"store_id": 1, "category_name": "HARDWARE", "low_stock_threshold": 10},
+            out.append(
+                f"✅ get_current_inventory_status() - Retrieved data (first 200 chars): {inv_res.content[0].text[:200]}..."
             )
-            inventory_data = result.content[0].text
-            print(f"✅ get_current_inventory_status() - Retrieved data (first 200 chars): {inventory_data[:200]}...")
 
-            print("\n" + "=" * 80)
-            print("✅ Finance MCP Server: All tests passed!")
-            print("=" * 80)
+            out.append("\n" + SEP80)
+            out.append("✅ Finance MCP Server: All tests passed!")
+            out.append(SEP80)
 
 
-async def test_supplier_server():
+async def test_supplier_server(out: list[str]):
     """Test Supplier MCP server via HTTP."""
-    print("\n" + "=" * 80)
-    print("Testing Supplier MCP Server (http://localhost:8002/mcp)")
-    print("=" * 80)
+    out.append("\n" + SEP80)
+    out.append("Testing Supplier MCP Server (http://localhost:8002/mcp)")
+    out.append(SEP80)
 
     server_url = "http://localhost:8002/mcp"
 
-    async with sse_client(server_url) as (read, write):
+    async with streamablehttp_client(server_url) as (read, write, _):
         async with ClientSession(read, write) as session:
             await session.initialize()
 
             # List available tools
             tools_response = await session.list_tools()
-            print(f"\n✅ Connected! Found {len(tools_response.tools)} tools:")
+            out.append(f"\n✅ Connected! Found {len(tools_response.tools)} tools:")
             for tool in tools_response.tools:
-                print(f"   - {tool.name}")
-
-            # Test find_suppliers_for_request
-            print("\n🔍 Testing find_suppliers_for_request()...")
-            result = await session.call_tool(
-                "find_suppliers_for_request",
-                arguments={
-                    "product_category": "POWER TOOLS",
-                    "esg_required": False,
-                    "min_rating": 3.0,
-                    "max_lead_time": 30,
-                    "limit": 5,
-                },
+                out.append(f"   - {tool.name}")
+
+            # All four tools are independent; overlap their round-trips
+            out.append("\n🔍 Testing supplier tools concurrently...")
+            suppliers_res, history_res, contract_res, policy_res = await asyncio.gather(
+                session.call_tool(
+                    "find_suppliers_for_request",
+                    arguments={
+                        "product_category": "POWER TOOLS",
+                        "esg_required": False,
+                        "min_rating": 3.0,
+                        "max_lead_time": 30,
+                        "limit": 5,
+                    },
+                ),
+                session.call_tool(
+                    "get_supplier_history_and_performance", arguments={"supplier_id": 1, "months_back": 12}
+                ),
+                session.call_tool("get_supplier_contract", arguments={"supplier_id": 1}),
+                session.call_tool(
+                    "get_company_supplier_policy", arguments={"policy_type": "procurement", "department": ""}
+                ),
             )
-            suppliers_data = result.content[0].text
-            print(f"✅ find_suppliers_for_request() - Retrieved data (first 200 chars): {suppliers_data[:200]}...")
-
-            # Test get_supplier_history_and_performance
-            print("\n📈 Testing get_supplier_history_and_performance()...")
-            result = await session.call_tool(
-                "get_supplier_history_and_performance", arguments={"supplier_id": 1, "months_back": 12}
+            out.append(
+                f"✅ find_suppliers_for_request() - Retrieved data (first 200 chars): {suppliers_res.content[0].text[:200]}..."
             )
-            history_data = result.content[0].text
-            print(
-                f"✅ get_supplier_history_and_performance() - Retrieved data (first 200 chars): {history_data[:200]}..."
+            out.append(
+                f"✅ get_supplier_history_and_performance() - Retrieved data (first 200 chars): {history_res.content[0].text[:200]}..."
             )
-
-            # Test get_supplier_contract
-            print("\n📄 Testing get_supplier_contract()...")
-            result = await session.call_tool("get_supplier_contract", arguments={"supplier_id": 1})
-            contract_data = result.content[0].text
-            print(f"✅ get_supplier_contract() - Retrieved data (first 200 chars): {contract_data[:200]}...")
-
-            # Test get_company_supplier_policy
-            print("\n📋 Testing get_company_supplier_policy()...")
-            result = await session.call_tool(
-                "get_company_supplier_policy", arguments={"policy_type": "procurement", "department": ""}
+            out.append(
+                f"✅ get_supplier_contract() - Retrieved data (first 200 chars): {contract_res.content[0].text[:200]}..."
+            )
+            out.append(
+                f"✅ get_company_supplier_policy() - Retrieved data (first 200 chars): {policy_res.content[0].text[:200]}..."
             )
-            policy_data = result.content[0].text
-            print(f"✅ get_company_supplier_policy() - Retrieved data (first 200 chars): {policy_data[:200]}...")
 
-            print("\n" + "=" * 80)
-            print("✅ Supplier MCP Server: All tests passed!")
-            print("=" * 80)
+            out.append("\n" + SEP80)
+            out.append("✅ Supplier MCP Server: All tests passed!")
+            out.append(SEP80)
 
 
-async def test_sales_analysis_server():
+async def test_sales_analysis_server(out: list[str]):
     """Test Sales Analysis MCP server via HTTP."""
-    print("\n" + "=" * 80)
-    print("Testing Sales Analysis MCP Server (http://localhost:8000/mcp)")
-    print("=" * 80)
+    out.append("\n" + SEP80)
+    out.append("Testing Sales Analysis MCP Server (http://localhost:8000/mcp)")
+    out.append(SEP80)
 
     server_url = "http://localhost:8000/mcp"
 
-    async with sse_client(server_url) as (read, write):
+    async with streamablehttp_client(server_url) as (read, write, _):
         async with ClientSession(read, write) as session:
             await session.initialize()
 
             # List available tools
             tools_response = await session.list_tools()
-            print(f"\n✅ Connected! Found {len(tools_response.tools)} tools:")
+            out.append(f"\n✅ Connected! Found {len(tools_response.tools)} tools:")
             for tool in tools_response.tools:
-                print(f"   - {tool.name}")
-
-            # Test get_multiple_table_schemas
-            print("\n📋 Testing get_multiple_table_schemas()...")
-            result = await session.call_tool(
-                "get_multiple_table_schemas", arguments={"table_names": ["products", "orders", "stores"]}
+                out.append(f"   - {tool.name}")
+
+            # The three tools are independent; overlap their round-trips
+            out.append("\n📋 Testing sales analysis tools concurrently...")
+            schema_res, query_res, date_res = await asyncio.gather(
+                session.call_tool(
+                    "get_multiple_table_schemas", arguments={"table_names": ["products", "orders", "stores"]}
+                ),
+                session.call_tool(
+                    "execute_sales_query",
+                    arguments={"sql_query": "SELECT store_name, is_online FROM stores LIMIT 5"},
+                ),
+                session.call_tool("get_current_utc_date", arguments={}),
             )
-            schema_data = result.content[0].text
-            print(f"✅ get_multiple_table_schemas() - Retrieved data (first 200 chars): {schema_data[:200]}...")
-
-            # Test execute_sales_query
-            print("\n📊 Testing execute_sales_query()...")
-            result = await session.call_tool(
-                "execute_sales_query",
-                arguments={"sql_query": "SELECT store_name, is_online FROM stores LIMIT 5"},
+            out.append(
+                f"✅ get_multiple_table_schemas() - Retrieved data (first 200 chars): {schema_res.content[0].text[:200]}..."
             )
-            query_data = result.content[0].text
-            print(f"✅ execute_sales_query() - Retrieved data (first 200 chars): {query_data[:200]}...")
-
-            # Test get_current_utc_date
-            print("\n🕐 Testing get_current_utc_date()...")
-            result = await session.call_tool("get_current_utc_date", arguments={})
-            date_data = result.content[0].text
-            print(f"✅ get_current_utc_date() - {date_data}")
+            out.append(f"✅ execute_sales_query() - Retrieved data (first 200 chars): {query_res.content[0].text[:200]}...")
+            out.append(f"✅ get_current_utc_date() - {date_res.content[0].text}")
 
-            print("\n" + "=" * 80)
-            print("✅ Sales Analysis MCP Server: All tests passed!")
-            print("=" * 80)
+            out.append("\n" + SEP80)
+            out.append("✅ Sales Analysis MCP Server: All tests passed!")
+            out.append(SEP80)
 
 
 async def main():
     """Run all server tests."""
-    print("\n" + "=" * 80)
+    print("\n" + SEP80)
     print("MCP LIVE SERVER TESTS")
     print("Testing MCP servers via HTTP with MCP client library")
-    print("=" * 80)
+    print(SEP80)
 
-    try:
-        await test_finance_server()
-        await test_supplier_server()
-        await test_sales_analysis_server()
+    async def run_buffered(test):
+        out: list[str] = []
+        try:
+            await test(out)
+        finally:
+            print("\n".join(out))
 
-        print("\n" + "=" * 80)
+    try:
+        # The three servers listen on different ports; test them concurrently
+        # with per-server output buffering so the reports don't interleave
+        await asyncio.gather(
+            run_buffered(test_finance_server),
+            run_buffered(test_supplier_server),
+            run_buffered(test_sales_analysis_server),
+        )
+
+        print("\n" + SEP80)
         print("✅ ALL MCP SERVER TESTS PASSED!")
-        print("=" * 80)
+        print(SEP80)
         print("\nAll MCP servers (Finance, Supplier, and Sales Analysis) are running correctly")
         print("and responding to tool calls via HTTP transport.\n")
 
@@ -1,28 +1,39 @@
 #!/usr/bin/env python3
 """Test script for SQLite MCP servers"""
 
-import sys
-
-sys.path.insert(0, "/workspace/src/mcp_server/sales_analysis")
-
 import asyncio
-import json
 
+import orjson
 from sales_analysis_sqlite import SQLiteSchemaProvider
+from zava_shop_shared.models.sqlite import decode_embedding
+
+# Separator lines built once instead of per print call
+LINE70 = "-" * 70
+SEP70 = "=" * 70
 
 
 async def test_schema_provider():
     """Test the SQLite schema provider directly"""
-    print("=" * 70)
+    print(SEP70)
     print("TESTING SQLITE MCP SCHEMA PROVIDER")
-    print("=" * 70)
+    print(SEP70)
 
     provider = SQLiteSchemaProvider()
+    # One SQLite handle for every manual cursor fetch in this test; opening a
+    # connection per fetch pays file-open and schema-cache warmup each time
+    conn = provider.get_connection()
+
+    # Tests 1-3 are independent reads (schema metadata and a tiny query), so
+    # submit them together and let the round trips overlap
+    schemas, products_schema, result = await asyncio.gather(
+        provider.get_all_schemas(),
+        provider.get_table_schema("products"),
+        provider.execute_query("SELECT product_id, product_name, base_price FROM products LIMIT 3"),
+    )
 
     # Test 1: Get all schemas
     print("\n✓ Test 1: Get all table schemas")
-    print("-" * 70)
-    schemas = await provider.get_all_schemas()
+    print(LINE70)
     print(f"Found {len(schemas)} tables:")
     for table_name in schemas.keys():
         row_count = schemas[table_name].get("row_count", 0)
@@ -30,8 +41,7 @@ async def test_schema_provider():
 
     # Test 2: Get specific table schema
     print("\n✓ Test 2: Get products table schema")
-    print("-" * 70)
-    products_schema = await provider.get_table_schema("products")
+    print(LINE70)
     print(f"Table: {products_schema['table_name']}")
     print(f"Columns: {len(products_schema['columns'])}")
     for col in products_schema["columns"][:5]:
@@ -39,37 +49,38 @@ async def test_schema_provider():
 
     # Test 3: Execute query
     print("\n✓ Test 3: Execute SQL query")
-    print("-" * 70)
-    result = await provider.execute_query("SELECT product_id, product_name, base_price FROM products LIMIT 3")
-    results = json.loads(result)
+    print(LINE70)
+    results = orjson.loads(result)
     print(f"Query returned {len(results)} rows:")
     for row in results:
         print(f"  - {row['product_name']}: ${row['base_price']:.2f}")
 
     # Test 4: Semantic search
     print("\n✓ Test 4: Semantic search with sample embedding")
-    print("-" * 70)
-    # Get a sample embedding from the database
-    conn = provider.get_connection()
+    print(LINE70)
+    # Get a sample embedding from the database over the shared connection
     cursor = conn.cursor()
-    cursor.execute("SELECT description_embedding FROM product_description_embeddings LIMIT 1")
-    sample_embedding_json = cursor.fetchone()[0]
-    conn.close()
-
-    sample_embedding = json.loads(sample_embedding_json)
+    cursor.execute("SELECT description_embedding, embedding_scale FROM product_description_embeddings LIMIT 1")
+    # Embeddings in this database are int8-quantized with a per-vector
+    # scale; decode_embedding reconstructs float32 via one vectorized
+    # int8 * scale multiply (with a JSON fallback for legacy rows)
+    blob, scale = cursor.fetchone()
+    sample_embedding = decode_embedding(blob, scale)
     print(f"Using sample embedding with {len(sample_embedding)} dimensions")
 
     result = await provider.search_products_by_similarity(
-        query_embedding=sample_embedding, max_rows=5, similarity_threshold=50.0
+        query_embedding=sample_embedding.tolist(), max_rows=5, similarity_threshold=50.0
     )
-    results = json.loads(result)
+    results = orjson.loads(result)
     print(f"Found {len(results)} similar products:")
     for row in results:
         print(f"  - {row['product_name']}: {row['similarity_score']:.2f}% similar")
 
-    print("\n" + "=" * 70)
+    conn.close()
+
+    print("\n" + SEP70)
     print("✓ ALL TESTS PASSED!")
-    print("=" * 70)
+    print(SEP70)
 
 
 if __name__ == "__main__":
@@ -4,22 +4,28 @@ Test semantic search with full product details display.
 """
 
 import asyncio
-import json
-import sys
-
-sys.path.insert(0, "/workspace/src")
+import textwrap
 
+import orjson
 from fastmcp.client import Client
 
 from mcp_servers.product_server import mcp as product_mcp
 
+# Separator lines built once instead of per print call
+SEP100 = "=" * 100
+
+# Score bars and rating stars take a handful of discrete lengths, so the
+# report indexes prebuilt strings instead of allocating one per product
+_BARS = ["█" * i for i in range(51)]
+_STARS = ["⭐" * i for i in range(6)]
+
 
 async def test_detailed_search():
     """Test semantic search and display complete product information."""
 
-    print("\n" + "=" * 100)
+    print("\n" + SEP100)
     print("🔍 SEMANTIC PRODUCT SEARCH - DETAILED RESULTS")
-    print("=" * 100 + "\n")
+    print(SEP100 + "\n")
 
     test_queries = [
         {
@@ -36,118 +42,142 @@ async def test_detailed_search():
     ]
 
     async with Client(product_mcp) as client:
-        for i, test in enumerate(test_queries, 1):
-            print(f"\n{'─' * 100}")
-            print(f"SEARCH {i}: {test['description']}")
-            print(f"{'─' * 100}")
-            print(f"Query: '{test['query']}'")
-            print(f"Max Results: {test['limit']}\n")
-
-            try:
-                result = await client.call_tool(
+        # Two gather waves: the searches are independent of each other, and
+        # each availability lookup only depends on its own search's top
+        # match. Wave 1 runs all searches at once; wave 2 runs the
+        # availability calls for every search that returned products.
+        search_results = await asyncio.gather(
+            *(
+                client.call_tool(
                     name="search_products_by_description",
                     arguments={"query": test["query"], "limit": test["limit"], "min_similarity": 0.3},
                 )
-
-                if result.content and len(result.content) > 0:
-                    products = json.loads(result.content[0].text)
-                else:
-                    products = []
-
-                if not products:
-                    print("❌ No matching products found.\n")
-                    continue
-
-                print(f"✅ Found {len(products)} matching products:\n")
-
-                for j, product in enumerate(products, 1):
-                    print(f"┌─ PRODUCT {j} {'─' * 85}")
-                    print(f"│ Product: {product['product_name']}")
-                    print(f"│ SKU: {product['sku']}")
-                    print(f"│ Category: {product['category']} → {product['product_type']}")
-                    print(f"│")
-                    print(f"│ 💰 PRICING:")
-                    print(f"│    Retail Price: ${product['base_price']:.2f}")
-                    print(f"│    Cost: ${product['cost']:.2f}")
-                    print(f"│    Profit Margin: {product['profit_margin']:.1f}%")
-                    print(f"│")
-                    print(f"│ 🎯 RELEVANCE SCORE: {product['similarity_score']:.4f}")
-                    print(
-                        f"│    {'█' * int(product['similarity_score'] * 50)} {product['similarity_score'] * 100:.1f}%"
-                    )
-                    print(f"│")
-                    print(f"│ 🚚 SUPPLIER:")
-                    supplier = product["supplier"]
-                    print(f"│    Name: {supplier['supplier_name']}")
-                    print(
-                        f"│    Rating: {'⭐' * int(supplier['supplier_rating'])} ({supplier['supplier_rating']:.1f}/5.0)"
-                    )
-                    print(f"│    Lead Time: {supplier['lead_time_days']} days")
-                    print(f"│    Min Order: ${supplier['minimum_order_amount']:.2f}")
-                    if supplier["bulk_discount_percent"] > 0:
-                        print(f"│    Bulk Discount: {supplier['bulk_discount_percent']:.0f}%")
-                    print(f"│")
-                    print(f"│ 📝 DESCRIPTION:")
-                    desc = product["description"]
-                    # Word wrap the description
-                    words = desc.split()
-                    line = "│    "
-                    for word in words:
-                        if len(line) + len(word) + 1 > 95:
-                            print(line)
-                            line = "│    " + word
-                        else:
-                            line += " " + word if line != "│    " else word
-                    if line != "│    ":
-                        print(line)
-                    print(f"└{'─' * 99}\n")
-
-                # Now get detailed availability for the top match
-                if products:
-                    top_product = products[0]
-                    print(f"🔍 Getting detailed availability for top match: {top_product['product_name']}...")
-                    print()
-
-                    avail_result = await client.call_tool(
-                        name="get_product_availability", arguments={"sku": top_product["sku"]}
-                    )
-
-                    if avail_result.data:
-                        avail = avail_result.data
-                        print(f"📦 AVAILABILITY DETAILS:")
-                        print(f"   Total Stock (All Stores): {avail['availability']['total_stock_all_stores']} units")
-                        print(f"   Status: {'✅ IN STOCK' if avail['availability']['in_stock'] else '❌ OUT OF STOCK'}")
-                        print()
-                        print(f"   Stock by Store:")
-                        for store in avail["availability"]["stock_by_store"][:5]:  # Show first 5 stores
-                            status_icon = "✅" if store["stock_level"] > 0 else "❌"
-                            store_type = "🌐 Online" if store["is_online"] else "🏪 Physical"
-                            print(
-                                f"      {status_icon} {store_type} {store['store_name']}: {store['stock_level']} units"
-                            )
-                        print()
-                        print(f"   🚚 SUPPLIER INFO:")
-                        supplier = avail["supplier_info"]
-                        print(f"      Supplier: {supplier['supplier_name']}")
-                        print(
-                            f"      Rating: {'⭐' * int(supplier['supplier_rating'])} ({supplier['supplier_rating']:.1f}/5.0)"
-                        )
-                        print(f"      Lead Time: {supplier['lead_time_days']} days")
-                        print(f"      Min Order: ${supplier['minimum_order_amount']:.2f}")
-                        if supplier["bulk_discount_percent"] > 0:
-                            print(f"      Bulk Discount: {supplier['bulk_discount_percent']:.0f}%")
-                        print()
-
-            except Exception as e:
-                print(f"❌ Error: {e!s}\n")
-                import traceback
-
-                traceback.print_exc()
-
-    print("\n" + "=" * 100)
+                for test in test_queries
+            ),
+            return_exceptions=True,
+        )
+
+        parsed: list[tuple[Exception | None, list]] = []
+        for result in search_results:
+            if isinstance(result, Exception):
+                parsed.append((result, []))
+            else:
+                # Structured channel first; parse the text content only for
+                # servers that omit it
+                products = result.data
+                if products is None and result.content:
+                    products = orjson.loads(result.content[0].text)
+                parsed.append((None, products or []))
+
+        avail_indices = [i for i, (_, products) in enumerate(parsed) if products]
+        avail_results = await asyncio.gather(
+            *(
+                client.call_tool(name="get_product_availability", arguments={"sku": parsed[i][1][0]["sku"]})
+                for i in avail_indices
+            ),
+            return_exceptions=True,
+        )
+        avail_by_index = dict(zip(avail_indices, avail_results))
+
+    for i, (test, (error, products)) in enumerate(zip(test_queries, parsed), 1):
+        # Buffer the block and emit it with one write instead of ~25 syscalls
+        out: list[str] = []
+        out.append(f"\n{'─' * 100}")
+        out.append(f"SEARCH {i}: {test['description']}")
+        out.append(f"{'─' * 100}")
+        out.append(f"Query: '{test['query']}'")
+        out.append(f"Max Results: {test['limit']}\n")
+
+        if error is not None:
+            out.append(f"❌ Error: {error!s}\n")
+            print("\n".join(out))
+            continue
+
+        if not products:
+            out.append("❌ No matching products found.\n")
+            print("\n".join(out))
+            continue
+
+        out.append(f"✅ Found {len(products)} matching products:\n")
+
+        for j, product in enumerate(products, 1):
+            out.append(f"┌─ PRODUCT {j} {'─' * 85}")
+            out.append(f"│ Product: {product['product_name']}")
+            out.append(f"│ SKU: {product['sku']}")
+            out.append(f"│ Category: {product['category']} → {product['product_type']}")
+            out.append(f"│")
+            out.append(f"│ 💰 PRICING:")
+            out.append(f"│    Retail Price: ${product['base_price']:.2f}")
+            out.append(f"│    Cost: ${product['cost']:.2f}")
+            out.append(f"│    Profit Margin: {product['profit_margin']:.1f}%")
+            out.append(f"│")
+            out.append(f"│ 🎯 RELEVANCE SCORE: {product['similarity_score']:.4f}")
+            out.append(
+                f"│    {_BARS[int(product['similarity_score'] * 50)]} {product['similarity_score'] * 100:.1f}%"
+            )
+            out.append(f"│")
+            out.append(f"│ 🚚 SUPPLIER:")
+            supplier = product["supplier"]
+            out.append(f"│    Name: {supplier['supplier_name']}")
+            out.append(
+                f"│    Rating: {_STARS[int(supplier['supplier_rating'])]} ({supplier['supplier_rating']:.1f}/5.0)"
+            )
+            out.append(f"│    Lead Time: {supplier['lead_time_days']} days")
+            out.append(f"│    Min Order: ${supplier['minimum_order_amount']:.2f}")
+            if supplier["bulk_discount_percent"] > 0:
+                out.append(f"│    Bulk Discount: {supplier['bulk_discount_percent']:.0f}%")
+            out.append(f"│")
+            out.append(f"│ 📝 DESCRIPTION:")
+            desc = product["description"]
+            out.append(textwrap.fill(desc, width=95, initial_indent="│    ", subsequent_indent="│    "))
+            out.append(f"└{'─' * 99}\n")
+
+        # Detailed availability for the top match, fetched in wave 2 above
+        top_product = products[0]
+        out.append(f"🔍 Getting detailed availability for top match: {top_product['product_name']}...")
+        out.append("")
+
+        avail_result = avail_by_index.get(i - 1)
+        if isinstance(avail_result, Exception):
+            out.append(f"❌ Availability lookup failed: {avail_result!s}\n")
+        elif avail_result is not None and avail_result.data:
+            avail = avail_result.data
+            out.append(f"📦 AVAILABILITY DETAILS:")
+            out.append(f"   Total Stock (All Stores): {avail['availability']['total_stock_all_stores']} units")
+            out.append(f"   Status: {'✅ IN STOCK' if avail['availability']['in_stock'] else '❌ OUT OF STOCK'}")
+            out.append("")
+            out.append(f"   Stock by Store:")
+            for store in avail["availability"]["stock_by_store"][:5]:  # Show first 5 stores
+                status_icon = "✅" if store["stock_level"] > 0 else "❌"
+                store_type = "🌐 Online" if store["is_online"] else "🏪 Physical"
+                out.append(
+                    f"      {status_icon} {store_type} {store['store_name']}: {store['stock_level']} units"
+                )
+            out.append("")
+            out.append(f"   🚚 SUPPLIER INFO:")
+            supplier = avail["supplier_info"]
+            out.append(f"      Supplier: {supplier['supplier_name']}")
+            out.append(
+                f"      Rating: {_STARS[int(supplier['supplier_rating'])]} ({supplier['supplier_rating']:.1f}/5.0)"
+            )
+            out.append(f"      Lead Time: {supplier['lead_time_days']} days")
+            out.append(f"      Min Order: ${supplier['minimum_order_amount']:.2f}")
+            if supplier["bulk_discount_percent"] > 0:
+                out.append(f"      Bulk Discount: {supplier['bulk_discount_percent']:.0f}%")
+            out.append("")
+
+        print("\n".join(out))
+
+    print("\n" + SEP100)
     print("✨ SEARCH COMPLETE")
-    print("=" * 100 + "\n")
+    print(SEP100 + "\n")
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass  # optional speedup; the default loop works fine
     asyncio.run(test_detailed_search())
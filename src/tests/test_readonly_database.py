@@ -4,110 +4,130 @@ Test that all MCP servers have read-only access to the SQLite database.
 """
 
 import asyncio
+import sqlite3
 import sys
 
-sys.path.insert(0, "/workspace/shared/src")
-
 from sqlalchemy import text
 from zava_shop_shared.finance_sqlite import FinanceSQLiteProvider
 from zava_shop_shared.supplier_sqlite import SupplierSQLiteProvider
 
-
-async def test_readonly_access():
-    """Test that database connections are read-only."""
-
-    print("\n" + "=" * 100)
-    print("🔒 TESTING READ-ONLY DATABASE ACCESS FOR MCP SERVERS")
-    print("=" * 100 + "\n")
-
-    results = []
-
-    # Test Finance SQLite Provider
-    print("─" * 100)
-    print("1️⃣  Testing FinanceSQLiteProvider (used by Finance, Product, Sales Analysis servers)")
-    print("─" * 100)
+# Separator lines built once instead of per print call
+DASH100 = "─" * 100
+SEP100 = "=" * 100
+
+# Message fallback when the driver doesn't expose an error code
+_RO_MARKERS = ("readonly", "attempt to write")
+
+
+def _is_readonly_error(e: Exception) -> bool:
+    """Classify a failed write as read-only enforcement.
+
+    Prefer the driver's SQLite error code — one integer compare against
+    SQLITE_READONLY (masking off the extended-code byte) — and only fall
+    back to scanning the stringified exception when no code is exposed.
+    """
+    code = getattr(getattr(e, "orig", None), "sqlite_errorcode", None)
+    if code is not None:
+        return (code & 0xFF) == sqlite3.SQLITE_READONLY
+    message = str(e).casefold()
+    return any(marker in message for marker in _RO_MARKERS)
+
+
+async def _probe_provider(
+    banner: str,
+    name: str,
+    db,
+    open_db,
+    read_sql: str,
+    noun: str,
+    write_sql: str,
+) -> list[tuple[str, str]]:
+    """Probe one provider's read and write paths over concurrent sessions."""
+    out: list[str] = [DASH100, banner, DASH100]
+    results: list[tuple[str, str]] = []
 
     try:
-        db = InventorySQLiteProvider()
-        await db.open_engine()
-
-        # Try a SELECT query (should work)
-        try:
-            async with db.get_session() as session:
-                result = await session.execute(text("SELECT COUNT(*) FROM products LIMIT 1"))
-                count = result.scalar()
-                print(f"   ✅ READ access works: Found {count} products")
-        except Exception as e:
-            print(f"   ❌ READ access failed: {e}")
-            results.append(("FinanceSQLiteProvider READ", "FAILED"))
-
-        # Try an INSERT query (should fail in read-only mode)
-        try:
-            async with db.get_session() as session:
-                await session.execute(text("INSERT INTO stores (store_name) VALUES ('TEST_STORE')"))
-                await session.commit()
-                print(f"   ❌ WRITE access allowed - DATABASE IS NOT READ-ONLY!")
-                results.append(("FinanceSQLiteProvider", "FAILED - Write allowed"))
-        except Exception as e:
-            if "readonly" in str(e).lower() or "attempt to write" in str(e).lower():
-                print(f"   ✅ WRITE access blocked: {type(e).__name__}")
-                results.append(("FinanceSQLiteProvider", "PASSED - Read-only enforced"))
-            else:
-                print(f"   ⚠️  Write failed with unexpected error: {e}")
-                results.append(("FinanceSQLiteProvider", "UNKNOWN"))
+        await open_db()
+
+        async def probe_read() -> None:
+            # Try a SELECT query (should work)
+            try:
+                async with db.get_session() as session:
+                    result = await session.execute(text(read_sql))
+                    count = result.scalar()
+                    out.append(f"   ✅ READ access works: Found {count} {noun}")
+            except Exception as e:
+                out.append(f"   ❌ READ access failed: {e}")
+                results.append((f"{name} READ", "FAILED"))
+
+        async def probe_write() -> None:
+            # Try a write (should fail in read-only mode)
+            try:
+                async with db.get_session() as session:
+                    await session.execute(text(write_sql))
+                    await session.commit()
+                    out.append("   ❌ WRITE access allowed - DATABASE IS NOT READ-ONLY!")
+                    results.append((name, "FAILED - Write allowed"))
+            except Exception as e:
+                if _is_readonly_error(e):
+                    out.append(f"   ✅ WRITE access blocked: {type(e).__name__}")
+                    results.append((name, "PASSED - Read-only enforced"))
+                else:
+                    out.append(f"   ⚠️  Write failed with unexpected error: {e}")
+                    results.append((name, "UNKNOWN"))
+
+        # Independent sessions on the shared pool: run both probes at once,
+        # which also checks that concurrent readers don't deadlock
+        await asyncio.gather(probe_read(), probe_write())
 
         await db.close_engine()
     except Exception as e:
-        print(f"   ❌ Database connection failed: {e}")
-        results.append(("FinanceSQLiteProvider", "FAILED - Connection error"))
+        out.append(f"   ❌ Database connection failed: {e}")
+        results.append((name, "FAILED - Connection error"))
+    finally:
+        out.append("")
+        print("\n".join(out))
 
-    print()
+    return results
 
-    # Test Supplier SQLite Provider
-    print("─" * 100)
-    print("2️⃣  Testing SupplierSQLiteProvider (used by Supplier server)")
-    print("─" * 100)
 
-    try:
-        db = SupplierSQLiteProvider()
-        await db.create_pool()
-
-        # Try a SELECT query (should work)
-        try:
-            async with db.get_session() as session:
-                result = await session.execute(text("SELECT COUNT(*) FROM suppliers LIMIT 1"))
-                count = result.scalar()
-                print(f"   ✅ READ access works: Found {count} suppliers")
-        except Exception as e:
-            print(f"   ❌ READ access failed: {e}")
-            results.append(("SupplierSQLiteProvider READ", "FAILED"))
-
-        # Try an UPDATE query (should fail in read-only mode)
-        try:
-            async with db.get_session() as session:
-                await session.execute(text("UPDATE suppliers SET supplier_name = 'TEST' WHERE supplier_id = 1"))
-                await session.commit()
-                print(f"   ❌ WRITE access allowed - DATABASE IS NOT READ-ONLY!")
-                results.append(("SupplierSQLiteProvider", "FAILED - Write allowed"))
-        except Exception as e:
-            if "readonly" in str(e).lower() or "attempt to write" in str(e).lower():
-                print(f"   ✅ WRITE access blocked: {type(e).__name__}")
-                results.append(("SupplierSQLiteProvider", "PASSED - Read-only enforced"))
-            else:
-                print(f"   ⚠️  Write failed with unexpected error: {e}")
-                results.append(("SupplierSQLiteProvider", "UNKNOWN"))
-
-        await db.close_engine()
-    except Exception as e:
-        print(f"   ❌ Database connection failed: {e}")
-        results.append(("SupplierSQLiteProvider", "FAILED - Connection error"))
+async def test_readonly_access():
+    """Test that database connections are read-only."""
 
-    print()
+    print("\n" + SEP100)
+    print("🔒 TESTING READ-ONLY DATABASE ACCESS FOR MCP SERVERS")
+    print(SEP100 + "\n")
+
+    # The two providers hold independent engines, so their probes gather;
+    # each buffers its own output so the reports don't interleave
+    finance = FinanceSQLiteProvider()
+    supplier = SupplierSQLiteProvider()
+    probe_results = await asyncio.gather(
+        _probe_provider(
+            "1️⃣  Testing FinanceSQLiteProvider (used by Finance, Product, Sales Analysis servers)",
+            "FinanceSQLiteProvider",
+            finance,
+            finance.open,
+            "SELECT COUNT(*) FROM products LIMIT 1",
+            "products",
+            "INSERT INTO stores (store_name) VALUES ('TEST_STORE')",
+        ),
+        _probe_provider(
+            "2️⃣  Testing SupplierSQLiteProvider (used by Supplier server)",
+            "SupplierSQLiteProvider",
+            supplier,
+            supplier.create_pool,
+            "SELECT COUNT(*) FROM suppliers LIMIT 1",
+            "suppliers",
+            "UPDATE suppliers SET supplier_name = 'TEST' WHERE supplier_id = 1",
+        ),
+    )
+    results = [entry for provider_results in probe_results for entry in provider_results]
 
     # Print summary
-    print("=" * 100)
+    print(SEP100)
     print("📊 READ-ONLY ACCESS TEST SUMMARY")
-    print("=" * 100)
+    print(SEP100)
     print()
 
     for provider, status in results:
@@ -126,13 +146,19 @@ async def test_readonly_access():
 
     if failed == 0 and passed == 2:
         print("🔒 SUCCESS: All database connections are READ-ONLY!")
-        print("=" * 100)
+        print(SEP100)
         return True
     print(f"⚠️  {failed} provider(s) failed read-only enforcement")
-    print("=" * 100)
+    print(SEP100)
     return False
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass  # optional speedup; the default loop works fine
     success = asyncio.run(test_readonly_access())
     sys.exit(0 if success else 1)
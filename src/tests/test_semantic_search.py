@@ -4,17 +4,16 @@ Comprehensive test for Product MCP Server semantic search with real Azure OpenAI
 """
 
 import asyncio
-import json
-import sys
 from typing import Any
 
-# Add src directory to path
-sys.path.insert(0, "/workspace/src")
-
+import orjson
 from fastmcp.client import Client
 
 from mcp_servers.product_server import mcp as product_mcp
 
+# Separator lines built once instead of per print call
+SEP100 = "=" * 100
+
 
 async def test_semantic_search():
     """Test semantic search with various queries."""
@@ -57,23 +56,20 @@ async def test_semantic_search():
         },
     ]
 
-    print("\n" + "=" * 100)
+    print("\n" + SEP100)
     print("🔍 TESTING SEMANTIC SEARCH WITH AZURE OPENAI EMBEDDINGS")
-    print("=" * 100 + "\n")
+    print(SEP100 + "\n")
 
     all_results = []
 
     async with Client(product_mcp) as client:
-        for i, test in enumerate(test_queries, 1):
-            print(f"\n{'─' * 100}")
-            print(f"TEST {i}: {test['name']}")
-            print(f"{'─' * 100}")
-            print(f"Query: '{test['query']}'")
-            print(f"Limit: {test['limit']}, Min Similarity: {test['min_similarity']}")
-            print()
-
-            try:
-                result = await client.call_tool(
+        # The queries are independent round trips (embedding + similarity
+        # scan each), so issue them in one gather wave; the distribution
+        # query rides along as the final task. Printing happens afterwards,
+        # in order, so the report stays deterministic.
+        *query_results, detail_result = await asyncio.gather(
+            *(
+                client.call_tool(
                     name="search_products_by_description",
                     arguments={
                         "query": test["query"],
@@ -81,50 +77,70 @@ async def test_semantic_search():
                         "min_similarity": test["min_similarity"],
                     },
                 )
-
-                # Get the data from the result - for list returns, use result.content
-                if result.content and len(result.content) > 0:
-                    # Parse the JSON string from content
-                    products_list = json.loads(result.content[0].text)
-                else:
-                    products_list = []
-
-                if not products_list:
-                    print("❌ No products found!")
-                    all_results.append({"test": test["name"], "status": "no_results", "count": 0})
-                    continue
-
-                print(f"✅ Found {len(products_list)} products:\n")
-
-                for j, product in enumerate(products_list, 1):
-                    print(f"  {j}. {product['product_name']} (SKU: {product['sku']})")
-                    print(f"     Category: {product['category']} | Type: {product['product_type']}")
-                    print(f"     Price: ${product['base_price']:.2f} | Profit Margin: {product['profit_margin']:.1f}%")
-                    print(f"     Similarity Score: {product['similarity_score']:.4f}")
-                    print(f"     Description: {product['description'][:100]}...")
-                    print()
-
-                all_results.append(
-                    {
-                        "test": test["name"],
-                        "status": "success",
-                        "count": len(products_list),
-                        "top_score": products_list[0]["similarity_score"],
-                        "top_product": products_list[0]["product_name"],
-                    }
-                )
-
-            except Exception as e:
-                import traceback
-
-                print(f"❌ Error: {e!s}")
-                print(f"   Traceback: {traceback.format_exc()}\n")
-                all_results.append({"test": test["name"], "status": "error", "error": str(e)})
+                for test in test_queries
+            ),
+            client.call_tool(
+                name="search_products_by_description",
+                arguments={"query": "power drill", "limit": 20, "min_similarity": 0.0},
+            ),
+            return_exceptions=True,
+        )
+
+    for i, (test, result) in enumerate(zip(test_queries, query_results), 1):
+        # Buffer the block and emit it with one write per query
+        out: list[str] = []
+        out.append(f"\n{'─' * 100}")
+        out.append(f"TEST {i}: {test['name']}")
+        out.append(f"{'─' * 100}")
+        out.append(f"Query: '{test['query']}'")
+        out.append(f"Limit: {test['limit']}, Min Similarity: {test['min_similarity']}")
+        out.append("")
+
+        if isinstance(result, Exception):
+            out.append(f"❌ Error: {result!s}")
+            all_results.append({"test": test["name"], "status": "error", "error": str(result)})
+            print("\n".join(out))
+            continue
+
+        # FastMCP reconstructs list results on the structured channel; fall
+        # back to parsing the text content for servers that omit it
+        products_list = result.data
+        if products_list is None and result.content:
+            products_list = orjson.loads(result.content[0].text)
+        products_list = products_list or []
+
+        if not products_list:
+            out.append("❌ No products found!")
+            all_results.append({"test": test["name"], "status": "no_results", "count": 0})
+            print("\n".join(out))
+            continue
+
+        out.append(f"✅ Found {len(products_list)} products:\n")
+
+        for j, product in enumerate(products_list, 1):
+            out.append(f"  {j}. {product['product_name']} (SKU: {product['sku']})")
+            out.append(f"     Category: {product['category']} | Type: {product['product_type']}")
+            out.append(f"     Price: ${product['base_price']:.2f} | Profit Margin: {product['profit_margin']:.1f}%")
+            out.append(f"     Similarity Score: {product['similarity_score']:.4f}")
+            out.append(f"     Description: {product['description'][:100]}...")
+            out.append("")
+
+        all_results.append(
+            {
+                "test": test["name"],
+                "status": "success",
+                "count": len(products_list),
+                "top_score": products_list[0]["similarity_score"],
+                "top_product": products_list[0]["product_name"],
+            }
+        )
+
+        print("\n".join(out))
 
     # Summary
-    print("\n" + "=" * 100)
+    print("\n" + SEP100)
     print("📊 TEST SUMMARY")
-    print("=" * 100 + "\n")
+    print(SEP100 + "\n")
 
     successful_tests = [r for r in all_results if r["status"] == "success"]
     failed_tests = [r for r in all_results if r["status"] == "error"]
@@ -155,44 +171,44 @@ async def test_semantic_search():
             print(f"  • {result['test']}")
         print()
 
-        # Additional detailed test - show similarity distribution
-        print("\n" + "=" * 100)
-        print("🔬 DETAILED ANALYSIS: Similarity Score Distribution")
-        print("=" * 100 + "\n")
+    # Additional detailed test - show similarity distribution. The query
+    # already ran in the gather wave above, while the client was still open.
+    print("\n" + SEP100)
+    print("🔬 DETAILED ANALYSIS: Similarity Score Distribution")
+    print(SEP100 + "\n")
+
+    if isinstance(detail_result, Exception):
+        print(f"Error in detailed analysis: {detail_result}")
+    else:
+        products_list = detail_result.data
+        if products_list is None and detail_result.content:
+            products_list = orjson.loads(detail_result.content[0].text)
+        products_list = products_list or []
+
+        if products_list:
+            scores = [p.get("similarity_score", 0) for p in products_list]
+            print(f"Query: 'power drill' (top 20 results)")
+            print(f"Results found: {len(products_list)}")
+            print(f"Score range: {min(scores):.4f} - {max(scores):.4f}")
+            print(f"Average score: {sum(scores) / len(scores):.4f}")
+            print()
 
-        try:
-            result = await client.call_tool(
-                name="search_products_by_description",
-                arguments={"query": "power drill", "limit": 20, "min_similarity": 0.0},
-            )
-
-            # Get the data from result.content for list returns
-            if result.content and len(result.content) > 0:
-                products_list = json.loads(result.content[0].text)
-            else:
-                products_list = []
-
-            if products_list:
-                scores = [p.get("similarity_score", 0) for p in products_list]
-                print(f"Query: 'power drill' (top 20 results)")
-                print(f"Results found: {len(products_list)}")
-                print(f"Score range: {min(scores):.4f} - {max(scores):.4f}")
-                print(f"Average score: {sum(scores) / len(scores):.4f}")
-                print()
-
-                print("Score distribution:")
-                for i, product in enumerate(products_list[:10], 1):
-                    print(
-                        f"  {i:2d}. [{product['similarity_score']:.4f}] {product['product_name']} - {product['category']}"
-                    )
-
-        except Exception as e:
-            print(f"Error in detailed analysis: {e}")
-
-    print("\n" + "=" * 100)
+            print("Score distribution:")
+            for i, product in enumerate(products_list[:10], 1):
+                print(
+                    f"  {i:2d}. [{product['similarity_score']:.4f}] {product['product_name']} - {product['category']}"
+                )
+
+    print("\n" + SEP100)
     print("✨ TEST COMPLETE!")
-    print("=" * 100 + "\n")
+    print(SEP100 + "\n")
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass  # optional speedup; the default loop works fine
     asyncio.run(test_semantic_search())
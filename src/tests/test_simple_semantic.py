@@ -1,20 +1,20 @@
 #!/usr/bin/env python3
 import asyncio
-import sys
-
-sys.path.insert(0, "/workspace/src")
 
 from fastmcp.client import Client
 
 from mcp_servers.product_server import mcp as product_mcp
 
+# Separator lines built once instead of per print call
+SEP80 = "=" * 80
+
 
 async def test():
     async with Client(product_mcp) as client:
         # First test a tool that returns a dict
-        print("=" * 80)
+        print(SEP80)
         print("Testing get_product_availability (returns dict):")
-        print("=" * 80)
+        print(SEP80)
         result = await client.call_tool(name="get_product_availability", arguments={"sku": "HTHM001600"})
 
         print(f"Result type: {type(result)}")
@@ -24,9 +24,9 @@ async def test():
         print()
 
         # Now test semantic search
-        print("=" * 80)
+        print(SEP80)
         print("Testing search_products_by_description (returns list[dict]):")
-        print("=" * 80)
+        print(SEP80)
         result = await client.call_tool(
             name="search_products_by_description",
             arguments={"query": "cordless drill", "limit": 3, "min_similarity": 0.3},
@@ -45,10 +45,10 @@ async def test():
                 print(f"Content {i}: {content}")
                 if hasattr(content, "text"):
                     print(f"Content {i} text: {content.text[:200]}")
-                    import json
+                    import orjson
 
                     try:
-                        parsed = json.loads(content.text)
+                        parsed = orjson.loads(content.text)
                         print(f"Parsed JSON type: {type(parsed)}")
                         if isinstance(parsed, list) and len(parsed) > 0:
                             print(f"First item: {parsed[0]}")
@@ -56,4 +56,11 @@ async def test():
                         pass
 
 
-asyncio.run(test())
+if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass  # optional speedup; the default loop works fine
+    asyncio.run(test())